@@ -452,7 +452,8 @@ def status_check():
         if llm_service:
             try:
                 llm_status = llm_service.get_health_status()
-                llm_info = llm_service.get_model_info()
+                model_info = llm_service.get_model_info()
+                llm_info = dict(model_info, configuration=dict(model_info['configuration']))
                 llm_stats = llm_service.get_usage_statistics()
                 status_data["services"]["llm"] = {
                     "health": llm_status,
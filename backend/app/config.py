@@ -168,6 +168,55 @@ class Config:
         """Timeout for LLM API calls in seconds."""
         return _get_int_env('LLM_TIMEOUT', 30, min_val=5, max_val=300)
 
+    @property
+    def LLM_TRANSPORT(self) -> str:
+        """Transport for Gemini API calls: grpc (default) or rest."""
+        transport = _get_env('LLM_TRANSPORT', 'grpc').lower()
+        if transport not in ('grpc', 'rest'):
+            logger.warning(f"Invalid LLM_TRANSPORT '{transport}', defaulting to 'grpc'")
+            return 'grpc'
+        return transport
+
+    @property
+    def LLM_RPM(self) -> int:
+        """Client-side limit on LLM requests per minute (0 disables throttling)."""
+        return _get_int_env('LLM_RPM', 0, min_val=0, max_val=10000)
+
+    @property
+    def LLM_MAX_CONCURRENCY(self) -> int:
+        """Maximum concurrent LLM requests issued by batch generation."""
+        return _get_int_env('LLM_MAX_CONCURRENCY', 4, min_val=1, max_val=64)
+
+    @property
+    def LLM_RESPONSE_CACHE_SIZE(self) -> int:
+        """Maximum cached LLM responses for deterministic prompts (0 disables caching)."""
+        return _get_int_env('LLM_RESPONSE_CACHE_SIZE', 512, min_val=0, max_val=100000)
+
+    @property
+    def LLM_RESPONSE_CACHE_TTL(self) -> int:
+        """Seconds to keep a cached LLM response."""
+        return _get_int_env('LLM_RESPONSE_CACHE_TTL', 3600, min_val=1, max_val=604800)
+
+    @property
+    def SEMANTIC_CACHE_ENABLED(self) -> bool:
+        """Reuse LLM responses for paraphrased prompts (needs sentence-transformers)."""
+        return _get_bool_env('SEMANTIC_CACHE_ENABLED', False)
+
+    @property
+    def SEMANTIC_CACHE_THRESHOLD(self) -> float:
+        """Minimum cosine similarity for a semantic cache hit."""
+        return _get_float_env('SEMANTIC_CACHE_THRESHOLD', 0.92, min_val=0.5, max_val=1.0)
+
+    @property
+    def SEMANTIC_CACHE_MAX_ENTRIES(self) -> int:
+        """Maximum number of prompts kept in the semantic cache."""
+        return _get_int_env('SEMANTIC_CACHE_MAX_ENTRIES', 1000, min_val=1, max_val=100000)
+
+    @property
+    def SEMANTIC_CACHE_MODEL(self) -> str:
+        """sentence-transformers model used to embed prompts for the semantic cache."""
+        return _get_env('SEMANTIC_CACHE_MODEL', 'all-MiniLM-L6-v2')
+
     @property
     def DATABASE_URI(self) -> str:
         """Database connection URI."""
@@ -183,6 +232,41 @@ class Config:
         """Database connection pool timeout in seconds."""
         return _get_int_env('DATABASE_POOL_TIMEOUT', 30, min_val=5, max_val=300)
 
+    @property
+    def DATABASE_POOL_MAX_OVERFLOW(self) -> int:
+        """Connections allowed beyond the pool size during bursts."""
+        return _get_int_env('DATABASE_POOL_MAX_OVERFLOW', 10, min_val=0, max_val=100)
+
+    @property
+    def DATABASE_POOL_RECYCLE(self) -> int:
+        """Seconds after which pooled connections are recycled (-1 disables)."""
+        return _get_int_env('DATABASE_POOL_RECYCLE', 3600, min_val=-1, max_val=86400)
+
+    @property
+    def DATABASE_POOL_USE_LIFO(self) -> bool:
+        """Reuse the most recently returned connection first (lets idle connections expire)."""
+        return _get_bool_env('DATABASE_POOL_USE_LIFO', True)
+
+    @property
+    def DATABASE_POOL_DISABLE(self) -> bool:
+        """Disable connection pooling (NullPool) for gevent or pre-forked worker deployments."""
+        return _get_bool_env('DATABASE_POOL_DISABLE', False)
+
+    @property
+    def DATABASE_CONNECT_TIMEOUT(self) -> int:
+        """Timeout in seconds for establishing a new database connection."""
+        return _get_int_env('DATABASE_CONNECT_TIMEOUT', 10, min_val=1, max_val=300)
+
+    @property
+    def DATABASE_STATEMENT_TIMEOUT_MS(self) -> int:
+        """Maximum run time in ms for a DatabaseService SQL statement (0 disables; agent SQL is not limited)."""
+        return _get_int_env('DATABASE_STATEMENT_TIMEOUT_MS', 30000, min_val=0, max_val=3600000)
+
+    @property
+    def DATABASE_SCHEMA_CACHE_TTL(self) -> int:
+        """Seconds to keep cached schema introspection results (0 disables caching)."""
+        return _get_int_env('DATABASE_SCHEMA_CACHE_TTL', 300, min_val=0, max_val=86400)
+
     @property
     def SECRET_KEY(self) -> str:
         """Flask secret key for session management."""
@@ -276,6 +360,51 @@ class Config:
         """Maximum execution time for agent in seconds."""
         return _get_int_env('AGENT_MAX_EXECUTION_TIME', 60, min_val=10, max_val=300)
 
+    @property
+    def AGENT_SAMPLE_ROWS(self) -> int:
+        """Sample rows per table included in schema descriptions given to the agent."""
+        return _get_int_env('AGENT_SAMPLE_ROWS', 1, min_val=0, max_val=10)
+
+    @property
+    def AGENT_POOL_SIZE(self) -> int:
+        """Maximum number of agent runs executing concurrently for streaming requests."""
+        return _get_int_env('AGENT_POOL_SIZE', 16, min_val=1, max_val=256)
+
+    @property
+    def AGENT_HEARTBEAT_INTERVAL(self) -> int:
+        """Seconds without agent events before a heartbeat is streamed."""
+        return _get_int_env('AGENT_HEARTBEAT_INTERVAL', 15, min_val=1, max_val=120)
+
+    @property
+    def ACTION_CACHE_TTL(self) -> int:
+        """Seconds to reuse outputs of repeated read-only agent tool calls (0 disables)."""
+        return _get_int_env('ACTION_CACHE_TTL', 300, min_val=0, max_val=86400)
+
+    @property
+    def ACTION_CACHE_QUERY_TTL(self) -> int:
+        """Seconds to reuse results of repeated read-only agent SQL queries (0 disables)."""
+        return _get_int_env('ACTION_CACHE_QUERY_TTL', 30, min_val=0, max_val=3600)
+
+    @property
+    def ACTION_CACHE_SIZE(self) -> int:
+        """Maximum number of cached agent tool outputs."""
+        return _get_int_env('ACTION_CACHE_SIZE', 1024, min_val=1)
+
+    @property
+    def AGENT_ANSWER_CACHE_ENABLED(self) -> bool:
+        """Replay earlier agent runs for paraphrased questions (needs sentence-transformers)."""
+        return _get_bool_env('AGENT_ANSWER_CACHE_ENABLED', False)
+
+    @property
+    def AGENT_ANSWER_CACHE_THRESHOLD(self) -> float:
+        """Minimum cosine similarity between questions for a cached answer to be replayed."""
+        return _get_float_env('AGENT_ANSWER_CACHE_THRESHOLD', 0.95, min_val=0.5, max_val=1.0)
+
+    @property
+    def AGENT_ANSWER_CACHE_TTL(self) -> int:
+        """Seconds to keep a cached agent run."""
+        return _get_int_env('AGENT_ANSWER_CACHE_TTL', 3600, min_val=1)
+
     def _validate_configuration(self) -> None:
         """Validate critical configuration settings."""
         validations = [
@@ -96,6 +96,7 @@ class AgentService:
         self.agent_executor: Optional[AgentExecutor] = None
         self.sql_database: Optional[SQLDatabase] = None
         self.toolkit: Optional[SQLDatabaseToolkit] = None
+        self._dialect_name = "unknown"  # Snapshot of the engine dialect, fixed for the service lifetime
 
         # Statistics and monitoring
         self._total_queries = 0
@@ -113,13 +114,11 @@ class AgentService:
     def _validate_dependencies(self) -> None:
         """Validate that required services are properly initialized."""
         try:
-            # Check LLM service
+            # Check LLM service; its connection is verified by the first request and
+            # the background health monitor rather than a live probe at startup
             if not self.llm_service or not self.llm_service.llm:
                 raise AgentInitializationError("LLM service is not properly initialized")
 
-            if not self.llm_service.test_connection():
-                raise AgentInitializationError("LLM service connection test failed")
-
             # Check Database service
             if not self.database_service or not self.database_service.engine:
                 raise AgentInitializationError("Database service is not properly initialized")
@@ -147,6 +146,10 @@ class AgentService:
                 sample_rows_in_table_info=3  # Include sample data in table descriptions
             )
 
+            # The dialect never changes for the lifetime of the service, so read it once
+            engine = self.database_service.engine
+            self._dialect_name = engine.dialect.name if engine else "unknown"
+
             # Create SQL toolkit
             self.toolkit = SQLDatabaseToolkit(
                 db=self.sql_database,
@@ -329,7 +332,7 @@ class AgentService:
 
         # Enhanced intermediate steps processing
         if include_intermediate_steps and "intermediate_steps" in custom_result:
-            react_steps = process_intermediate_steps(custom_result["intermediate_steps"])
+            react_steps = list(process_intermediate_steps(custom_result["intermediate_steps"]))
 
             formatted["react_loop"] = {
                 "steps": react_steps,
@@ -342,7 +345,7 @@ class AgentService:
         formatted["metadata"] = {
             "agent_type": self.config.AGENT_TYPE,
             "model_name": self.config.GEMINI_MODEL_NAME,
-            "database_type": self.database_service.engine.dialect.name if self.database_service.engine else "unknown",
+            "database_type": self._dialect_name,
             "total_iterations": len(custom_result.get("intermediate_steps", [])),
             "success": True,
             "processing_details": {
@@ -425,7 +428,7 @@ class AgentService:
 
         try:
             return {
-                "database_type": self.database_service.engine.dialect.name,
+                "database_type": self._dialect_name,
                 "available_tables": self.sql_database.get_usable_table_names(),
                 "sample_table_info": self._get_sample_table_info()
             }
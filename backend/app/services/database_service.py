@@ -7,8 +7,8 @@ from LLM logic and can be used independently.
 
 Features:
 - SQLAlchemy database connection management
-- Connection pooling and health monitoring
-- Schema inspection and metadata retrieval
+- Connection pooling and background health monitoring
+- Schema inspection and metadata retrieval with TTL caching
 - Query execution with error handling
 - Database connectivity testing
 - Connection lifecycle management
@@ -26,14 +26,18 @@ Usage:
         print(f"Available tables: {tables}")
 """
 
+import threading
 import time
 from contextlib import contextmanager
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from itertools import islice
+from typing import List, Dict, Any, Optional, Tuple, Iterable
 
-from sqlalchemy import create_engine, text, inspect, MetaData
+from sqlalchemy import create_engine, event, text, inspect, MetaData, Table
 from sqlalchemy.engine import Engine
+from sqlalchemy.sql.elements import TextClause
 from sqlalchemy.exc import SQLAlchemyError, OperationalError, TimeoutError
-from sqlalchemy.pool import StaticPool, QueuePool
+from sqlalchemy.pool import StaticPool, QueuePool, NullPool
 
 from backend.app.config import Config
 from backend.app.utils import get_logger, log_exception
@@ -57,6 +61,154 @@ class DatabaseQueryError(DatabaseError):
     pass
 
 
+# Catalog-based row count estimates; O(1) lookups instead of a COUNT(*) scan
+_ROWCOUNT_ESTIMATE_SQL = {
+    'postgresql': """
+        SELECT CAST(c.reltuples AS BIGINT)
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE c.relname = :table_name AND n.nspname = current_schema()
+    """,
+    'mysql': """
+        SELECT TABLE_ROWS
+        FROM information_schema.TABLES
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name
+    """,
+}
+
+# Per-connection SQLite tuning for a read-heavy workload
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",  # Readers no longer block on the writer
+    "PRAGMA synchronous=NORMAL",  # Safe with WAL, avoids an fsync per transaction
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MB memory-mapped reads
+    "PRAGMA cache_size=-65536",  # 64 MB page cache
+)
+
+# Session settings bounding statement (and lock wait) time, in milliseconds
+_STATEMENT_TIMEOUT_SQL = {
+    'postgresql': ("SET statement_timeout = {ms}", "SET lock_timeout = {ms}"),
+    'mysql': ("SET SESSION MAX_EXECUTION_TIME = {ms}",),
+}
+
+# SQLite VM instructions between statement deadline checks
+_SQLITE_PROGRESS_INTERVAL = 10000
+
+# Rows fetched per round-trip when streaming query results
+_STREAM_BATCH_SIZE = 1000
+
+# Statements that are never allowed through execute_query
+_DESTRUCTIVE_SET = frozenset({'DROP', 'DELETE', 'UPDATE', 'INSERT', 'ALTER', 'CREATE', 'TRUNCATE'})
+
+# Bulk introspection queries. Each dialect returns rows normalized to:
+#   columns: (table, column, type, is_nullable 'YES'/'NO', default)
+#   keys:    (table, constraint, 'PRIMARY KEY'/'FOREIGN KEY', column, referred_table, referred_column)
+#   indexes: (table, index, is_unique, column)
+_POSTGRES_COLUMNS_SQL = """
+    SELECT c.table_name, c.column_name, c.data_type, c.is_nullable, c.column_default
+    FROM information_schema.columns c
+    JOIN information_schema.tables t
+      ON t.table_schema = c.table_schema AND t.table_name = c.table_name
+    WHERE c.table_schema = current_schema() AND t.table_type = 'BASE TABLE'
+    ORDER BY c.table_name, c.ordinal_position
+"""
+
+_POSTGRES_KEYS_SQL = """
+    SELECT kcu.table_name, kcu.constraint_name, tc.constraint_type, kcu.column_name,
+           rk.table_name, rk.column_name
+    FROM information_schema.table_constraints tc
+    JOIN information_schema.key_column_usage kcu
+      ON kcu.constraint_schema = tc.constraint_schema
+     AND kcu.constraint_name = tc.constraint_name
+     AND kcu.table_name = tc.table_name
+    LEFT JOIN information_schema.referential_constraints rc
+      ON rc.constraint_schema = tc.constraint_schema AND rc.constraint_name = tc.constraint_name
+    LEFT JOIN information_schema.key_column_usage rk
+      ON rk.constraint_schema = rc.unique_constraint_schema
+     AND rk.constraint_name = rc.unique_constraint_name
+     AND rk.ordinal_position = kcu.position_in_unique_constraint
+    WHERE tc.table_schema = current_schema()
+      AND tc.constraint_type IN ('PRIMARY KEY', 'FOREIGN KEY')
+    ORDER BY kcu.table_name, kcu.constraint_name, kcu.ordinal_position
+"""
+
+_POSTGRES_INDEXES_SQL = """
+    SELECT t.relname, i.relname, ix.indisunique, a.attname
+    FROM pg_class t
+    JOIN pg_namespace n ON n.oid = t.relnamespace
+    JOIN pg_index ix ON ix.indrelid = t.oid
+    JOIN pg_class i ON i.oid = ix.indexrelid
+    JOIN LATERAL unnest(ix.indkey) WITH ORDINALITY AS k(attnum, ord) ON true
+    JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = k.attnum
+    WHERE n.nspname = current_schema() AND t.relkind = 'r' AND NOT ix.indisprimary
+    ORDER BY t.relname, i.relname, k.ord
+"""
+
+_MYSQL_COLUMNS_SQL = """
+    SELECT c.TABLE_NAME, c.COLUMN_NAME, c.COLUMN_TYPE, c.IS_NULLABLE, c.COLUMN_DEFAULT
+    FROM information_schema.COLUMNS c
+    JOIN information_schema.TABLES t
+      ON t.TABLE_SCHEMA = c.TABLE_SCHEMA AND t.TABLE_NAME = c.TABLE_NAME
+    WHERE c.TABLE_SCHEMA = DATABASE() AND t.TABLE_TYPE = 'BASE TABLE'
+    ORDER BY c.TABLE_NAME, c.ORDINAL_POSITION
+"""
+
+_MYSQL_KEYS_SQL = """
+    SELECT kcu.TABLE_NAME, kcu.CONSTRAINT_NAME, tc.CONSTRAINT_TYPE, kcu.COLUMN_NAME,
+           kcu.REFERENCED_TABLE_NAME, kcu.REFERENCED_COLUMN_NAME
+    FROM information_schema.KEY_COLUMN_USAGE kcu
+    JOIN information_schema.TABLE_CONSTRAINTS tc
+      ON tc.CONSTRAINT_SCHEMA = kcu.CONSTRAINT_SCHEMA
+     AND tc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME
+     AND tc.TABLE_NAME = kcu.TABLE_NAME
+    WHERE kcu.TABLE_SCHEMA = DATABASE()
+      AND tc.CONSTRAINT_TYPE IN ('PRIMARY KEY', 'FOREIGN KEY')
+    ORDER BY kcu.TABLE_NAME, kcu.CONSTRAINT_NAME, kcu.ORDINAL_POSITION
+"""
+
+_MYSQL_INDEXES_SQL = """
+    SELECT TABLE_NAME, INDEX_NAME, NON_UNIQUE = 0, COLUMN_NAME
+    FROM information_schema.STATISTICS
+    WHERE TABLE_SCHEMA = DATABASE() AND INDEX_NAME <> 'PRIMARY'
+    ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX
+"""
+
+
+@lru_cache(maxsize=256)
+def _compile(query: str) -> TextClause:
+    """Build the TextClause for a SQL string, reusing it for repeated queries."""
+    return text(query)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Engine 'connect' listener that applies _SQLITE_PRAGMAS to new SQLite connections."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    except Exception as err:
+        # A read-only database file cannot switch journal mode; keep the connection usable
+        logger.warning(f"Could not apply SQLite PRAGMA settings: {err}")
+    finally:
+        cursor.close()
+
+
+def _install_sqlite_progress_handler(dbapi_connection, connection_record) -> None:
+    """Engine 'connect' listener that aborts SQLite statements past their deadline."""
+    set_progress_handler = getattr(dbapi_connection, 'set_progress_handler', None)
+    if set_progress_handler is None:
+        # The aiosqlite adapter does not expose progress handlers
+        return
+
+    info = connection_record.info
+
+    def _check_deadline() -> int:
+        # A non-zero return interrupts the running statement
+        return int(time.monotonic() > info.get('statement_deadline', float('inf')))
+
+    set_progress_handler(_check_deadline, _SQLITE_PROGRESS_INTERVAL)
+
+
 def _mask_uri(uri: str) -> str:
     """Mask sensitive information in database URI for logging."""
     if '://' in uri:
@@ -86,25 +238,53 @@ class DatabaseService:
         """
         self.config = custom_config
         self.engine: Optional[Engine] = None
+        self._masked_uri = ''
+        self._dialect_name: Optional[str] = None
+        self._pool_class_name: Optional[str] = None
         self._metadata: Optional[MetaData] = None
+        self._metadata_lock = threading.Lock()
         self._last_health_check: Optional[float] = None
         self._health_check_interval = 300  # 5 minutes
+        self._cached_healthy = False
+        self._health_stop = threading.Event()
+        self._health_thread: Optional[threading.Thread] = None
+
+        # Schema introspection cache: entries are (value, fetched_at) pairs
+        self._schema_cache_ttl = self.config.DATABASE_SCHEMA_CACHE_TTL
+        self._schema_cache: Dict[str, Tuple[Dict[str, Any], float]] = {}
+        # get_all_schemas() catalog results, kept apart because their layout
+        # differs slightly from get_table_schema() (see get_all_schemas)
+        self._bulk_schema_cache: Dict[str, Tuple[Dict[str, Any], float]] = {}
+        self._table_names_cache: Optional[Tuple[List[str], float]] = None
 
         logger.info("Initializing DatabaseService")
         self._initialize_engine()
         self._verify_connection()
+        self._start_health_monitor()
         logger.info("DatabaseService initialized successfully")
 
     def _initialize_engine(self) -> None:
         """Initialize SQLAlchemy engine with appropriate configuration."""
         try:
             database_uri = self.config.DATABASE_URI
-            logger.info(f"Creating database engine for: {_mask_uri(database_uri)}")
+            self._masked_uri = _mask_uri(database_uri)
+            logger.info("Creating database engine for: %s", self._masked_uri)
 
             # Configure engine parameters based on database type
             engine_kwargs = self._get_engine_kwargs(database_uri)
 
             self.engine = create_engine(database_uri, **engine_kwargs)
+
+            if database_uri.startswith(('sqlite:', 'sqlite+')):
+                event.listen(self.engine, 'connect', _apply_sqlite_pragmas)
+            self._install_statement_timeout(self.engine)
+
+            # Engine metadata is immutable, so snapshot it once
+            self._dialect_name = self.engine.dialect.name
+            self._pool_class_name = type(self.engine.pool).__name__
+
+            # Reflected lazily, table by table, as schemas are requested
+            self._metadata = MetaData()
             logger.info("Database engine created successfully")
 
         except Exception as err:
@@ -112,6 +292,66 @@ class DatabaseService:
             logger.error(error_msg)
             raise DatabaseConnectionError(error_msg) from err
 
+    def _install_statement_timeout(self, engine: Engine) -> None:
+        """
+        Bound how long a single statement may run on connections from an engine.
+
+        PostgreSQL and MySQL get session-level timeouts when each connection
+        is opened. SQLite has no such setting, so every cursor execution
+        records a deadline that a progress handler enforces.
+
+        Only engines created by this service are limited. The agents run
+        their SQL through LangChain's own SQLDatabase.from_uri engine, which
+        has no statement timeout.
+
+        Args:
+            engine: Engine whose connections should be limited
+        """
+        timeout_ms = self.config.DATABASE_STATEMENT_TIMEOUT_MS
+        if timeout_ms <= 0:
+            return
+
+        dialect_name = engine.dialect.name
+        if dialect_name == 'sqlite':
+            timeout = timeout_ms / 1000
+
+            def _set_deadline(conn, cursor, statement, parameters, context, executemany) -> None:
+                conn.info['statement_deadline'] = time.monotonic() + timeout
+
+            event.listen(engine, 'before_cursor_execute', _set_deadline)
+            event.listen(engine, 'connect', _install_sqlite_progress_handler)
+
+        elif dialect_name in _STATEMENT_TIMEOUT_SQL:
+            statements = [sql.format(ms=int(timeout_ms)) for sql in _STATEMENT_TIMEOUT_SQL[dialect_name]]
+
+            # PostgreSQL SETs are transactional: run outside a transaction so the
+            # pool's rollback on connection return does not undo them
+            use_autocommit = dialect_name == 'postgresql'
+
+            def _apply_statement_timeout(dbapi_connection, connection_record) -> None:
+                if use_autocommit:
+                    existing_autocommit = dbapi_connection.autocommit
+                    dbapi_connection.autocommit = True
+                cursor = dbapi_connection.cursor()
+                try:
+                    for statement in statements:
+                        cursor.execute(statement)
+                except Exception as err:
+                    # e.g. MariaDB has no MAX_EXECUTION_TIME; run without a limit
+                    logger.warning("Could not apply statement timeout: %s", err)
+                finally:
+                    cursor.close()
+                    if use_autocommit:
+                        dbapi_connection.autocommit = existing_autocommit
+
+            event.listen(engine, 'connect', _apply_statement_timeout)
+
+        else:
+            logger.warning("Statement timeout is not supported for %s databases", dialect_name)
+            return
+
+        logger.debug("Statement timeout set to %d ms", timeout_ms)
+
     def _get_engine_kwargs(self, database_uri: str) -> Dict[str, Any]:
         """
         Get engine configuration based on database type.
@@ -125,9 +365,10 @@ class DatabaseService:
         kwargs = {
             'echo': self.config.FLASK_DEBUG,  # Log SQL queries in debug mode
             'future': True,  # Use SQLAlchemy 2.0 style
+            'query_cache_size': 1200,  # Compiled statement cache shared across connections
         }
 
-        if database_uri.startswith('sqlite:'):
+        if database_uri.startswith(('sqlite:', 'sqlite+')):
             # SQLite-specific configuration
             kwargs.update({
                 'poolclass': StaticPool,
@@ -143,12 +384,24 @@ class DatabaseService:
             kwargs.update({
                 'poolclass': QueuePool,
                 'pool_size': self.config.DATABASE_POOL_SIZE,
+                'max_overflow': self.config.DATABASE_POOL_MAX_OVERFLOW,
                 'pool_timeout': self.config.DATABASE_POOL_TIMEOUT,
-                'pool_recycle': 3600,  # Recycle connections every hour
+                'pool_recycle': self.config.DATABASE_POOL_RECYCLE,
+                'pool_use_lifo': self.config.DATABASE_POOL_USE_LIFO,
                 'pool_pre_ping': True,  # Verify connections before use
+                'connect_args': {
+                    'connect_timeout': self.config.DATABASE_CONNECT_TIMEOUT
+                }
             })
-            logger.debug("Using connection pooling configuration")
 
+            if self.config.DATABASE_POOL_DISABLE:
+                # Pools must not be shared across forked or gevent workers;
+                # open a fresh connection per checkout instead
+                kwargs['poolclass'] = NullPool
+                for pool_option in ('pool_size', 'max_overflow', 'pool_timeout', 'pool_use_lifo'):
+                    kwargs.pop(pool_option, None)
+
+        logger.info("Using %s for database connections", kwargs['poolclass'].__name__)
         return kwargs
 
     def _verify_connection(self) -> None:
@@ -156,6 +409,22 @@ class DatabaseService:
         if not self.test_connection():
             raise DatabaseConnectionError("Failed to establish database connection during initialization")
 
+    def _start_health_monitor(self) -> None:
+        """Start a daemon thread that refreshes the cached health status periodically."""
+        self._health_thread = threading.Thread(
+            target=self._health_monitor_loop,
+            name="database-health-monitor",
+            daemon=True
+        )
+        self._health_thread.start()
+
+    def _health_monitor_loop(self) -> None:
+        """Probe the database every health check interval until the service is closed."""
+        while not self._health_stop.wait(self._health_check_interval):
+            if not self.test_connection():
+                # Failed probes are checks too; last_check shows when the outage was seen
+                self._last_health_check = time.time()
+
     @contextmanager
     def get_connection(self):
         """
@@ -210,12 +479,31 @@ class DatabaseService:
                 custom_result.fetchone()
                 logger.debug("Database connection test successful")
                 self._last_health_check = time.time()
+                self._cached_healthy = True
                 return True
 
         except Exception as err:
             log_exception(logger, err, "database connection test")
+            self._cached_healthy = False
             return False
 
+    def health_check(self, use_cache: bool = True) -> bool:
+        """
+        Report database health, reusing a recent probe result when allowed.
+
+        Args:
+            use_cache: If True, return the cached result while it is younger
+                than the health check interval instead of running SELECT 1
+
+        Returns:
+            True if the database is reachable, False otherwise
+        """
+        if (use_cache and self._last_health_check and
+                time.time() - self._last_health_check <= self._health_check_interval):
+            return self._cached_healthy
+
+        return self.test_connection()
+
     def get_health_status(self) -> Dict[str, Any]:
         """
         Get comprehensive database health status.
@@ -233,20 +521,12 @@ class DatabaseService:
 
         try:
             if self.engine:
-                status['database_type'] = self.engine.dialect.name
-                status['connection_info'] = {
-                    'pool_size': getattr(self.engine.pool, 'size', 'N/A'),
-                    'checked_out': getattr(self.engine.pool, 'checked_out', 'N/A'),
-                    'checked_in': getattr(self.engine.pool, 'checked_in', 'N/A'),
-                }
+                status['database_type'] = self._dialect_name
+                status['connection_info'] = self._pool_snapshot()
 
-            # Perform connection test if it's been a while
-            current_time = time.time()
-            if (not self._last_health_check or
-                    current_time - self._last_health_check > self._health_check_interval):
-                status['connected'] = self.test_connection()
-            else:
-                status['connected'] = True  # Assume healthy if recently checked
+            # The background monitor keeps this current; never probe inline, so
+            # status polls stay fast even while the database is unreachable
+            status['connected'] = self._cached_healthy if self.engine else False
 
         except Exception as err:
             log_exception(logger, err, "health status check")
@@ -254,22 +534,168 @@ class DatabaseService:
 
         return status
 
+    def _pool_snapshot(self) -> Dict[str, Any]:
+        """
+        Read connection pool counters without checking out a connection.
+
+        Returns:
+            Dictionary with the pool class and, for QueuePool, its size and
+            checked-in/checked-out/overflow counts
+        """
+        pool = self.engine.pool
+        snapshot = {
+            'pool_class': self._pool_class_name,
+            'status': pool.status(),
+        }
+        if isinstance(pool, QueuePool):
+            snapshot.update({
+                'pool_size': pool.size(),
+                'checked_out': pool.checkedout(),
+                'checked_in': pool.checkedin(),
+                'overflow': pool.overflow(),
+            })
+        return snapshot
+
+    def _is_cache_fresh(self, fetched_at: float) -> bool:
+        """Check whether a cache entry fetched at the given time is still valid."""
+        return time.time() - fetched_at < self._schema_cache_ttl
+
+    def invalidate_schema_cache(self, table_name: Optional[str] = None) -> None:
+        """
+        Drop cached schema information so the next call re-inspects the database.
+
+        Args:
+            table_name: Optional table to invalidate. If None, the whole cache
+                (including the table name list) is cleared.
+        """
+        if table_name is None:
+            self._schema_cache.clear()
+            self._bulk_schema_cache.clear()
+            self._table_names_cache = None
+            with self._metadata_lock:
+                if self._metadata is not None:
+                    self._metadata.clear()
+            logger.debug("Schema cache cleared")
+        else:
+            self._schema_cache.pop(table_name, None)
+            self._bulk_schema_cache.pop(table_name, None)
+            self._drop_reflected_tables([table_name])
+            logger.debug("Schema cache invalidated for table: %s", table_name)
+
+    def _drop_reflected_tables(self, table_names: Iterable[str]) -> None:
+        """Remove tables from the reflected MetaData so they are reflected again."""
+        with self._metadata_lock:
+            if self._metadata is None:
+                return
+            for name in table_names:
+                table = self._metadata.tables.get(name)
+                if table is not None:
+                    self._metadata.remove(table)
+
+    def refresh_metadata(self, tables: Optional[List[str]] = None) -> None:
+        """
+        Reflect tables from the current schema into the cached MetaData.
+
+        Tables that were already reflected are dropped and reflected again.
+        SQLAlchemy reflects the requested tables in one pass, batching the
+        catalog queries where the dialect supports it.
+
+        Args:
+            tables: Optional table names to reflect. If None, every table in
+                the current schema is reflected.
+
+        Raises:
+            DatabaseError: If reflection fails
+        """
+        if self._metadata is None:
+            raise DatabaseConnectionError("Database engine not initialized")
+
+        if tables is None:
+            with self._metadata_lock:
+                self._metadata.clear()
+        else:
+            self._drop_reflected_tables(tables)
+
+        try:
+            with self.get_connection() as conn:
+                with self._metadata_lock:
+                    self._metadata.reflect(bind=conn, only=tables)
+
+            logger.debug("Reflected metadata for %s tables",
+                         len(tables) if tables is not None else "all")
+
+        except DatabaseError:
+            raise
+
+        except Exception as err:
+            error_msg = f"Failed to reflect database metadata: {err}"
+            logger.error(error_msg)
+            raise DatabaseError(error_msg) from err
+
+    @staticmethod
+    def _schema_from_table(table: Table) -> Dict[str, Any]:
+        """Build the get_table_schema() structure from a reflected Table."""
+        return {
+            'table_name': table.name,
+            'columns': [
+                {
+                    'name': column.name,
+                    'type': column.type,
+                    'nullable': column.nullable,
+                    'default': str(column.server_default.arg) if column.server_default is not None else None,
+                    'comment': column.comment,
+                }
+                for column in table.columns
+            ],
+            'primary_key': {
+                'name': table.primary_key.name,
+                'constrained_columns': [column.name for column in table.primary_key.columns],
+            },
+            'foreign_keys': [
+                {
+                    'name': fk.name,
+                    'constrained_columns': list(fk.column_keys),
+                    'referred_schema': fk.referred_table.schema,
+                    'referred_table': fk.referred_table.name,
+                    'referred_columns': [element.column.name for element in fk.elements],
+                }
+                for fk in table.foreign_key_constraints
+            ],
+            'indexes': [
+                {
+                    'name': index.name,
+                    'column_names': [column.name for column in index.columns],
+                    'unique': bool(index.unique),
+                }
+                for index in table.indexes
+            ],
+        }
+
     def get_table_names(self) -> List[str]:
         """
         Get list of all table names in the database.
 
+        Results are cached for DATABASE_SCHEMA_CACHE_TTL seconds.
+
         Returns:
             List of table names
 
         Raises:
             DatabaseError: If unable to retrieve table names
         """
+        cached = self._table_names_cache
+        if cached is not None and self._is_cache_fresh(cached[1]):
+            return list(cached[0])
+
         try:
             with self.get_connection() as conn:
                 inspector = inspect(conn)
                 tables = inspector.get_table_names()
-                logger.debug(f"Retrieved {len(tables)} table names")
-                return tables
+                logger.debug("Retrieved %d table names", len(tables))
+
+            if self._schema_cache_ttl > 0:
+                self._table_names_cache = (tables, time.time())
+            return list(tables)
 
         except Exception as err:
             error_msg = f"Failed to retrieve table names: {err}"
@@ -280,6 +706,11 @@ class DatabaseService:
         """
         Get detailed schema information for a specific table.
 
+        The table is reflected into the shared MetaData on first use and read
+        back from its Table object. Results are cached per table for
+        DATABASE_SCHEMA_CACHE_TTL seconds, after which the table is reflected
+        again; use invalidate_schema_cache() after DDL changes.
+
         Args:
             table_name: Name of the table
 
@@ -289,45 +720,309 @@ class DatabaseService:
         Raises:
             DatabaseError: If unable to retrieve table schema
         """
+        cached = self._schema_cache.get(table_name)
+        if cached is not None and self._is_cache_fresh(cached[1]):
+            return cached[0]
+
+        try:
+            table = None
+            if cached is None and self._schema_cache_ttl > 0 and self._metadata is not None:
+                # Already reflected (e.g. by refresh_metadata()) but not yet cached
+                table = self._metadata.tables.get(table_name)
+            if table is None:
+                self.refresh_metadata([table_name])
+                table = self._metadata.tables[table_name]
+
+            schema_info = self._schema_from_table(table)
+            logger.debug("Retrieved schema for table: %s", table_name)
+
+            if self._schema_cache_ttl > 0:
+                self._schema_cache[table_name] = (schema_info, time.time())
+            return schema_info
+
+        except Exception as err:
+            error_msg = f"Failed to retrieve schema for table '{table_name}': {err}"
+            logger.error(error_msg)
+            raise DatabaseError(error_msg) from err
+
+    def get_all_schemas(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get schema information for every table in a single introspection pass.
+
+        PostgreSQL and MySQL read columns, keys and indexes for all tables with
+        one query each against the catalog; SQLite walks the PRAGMAs on a single
+        connection. Other dialects reflect all tables in one serial
+        MetaData.reflect() pass on a single connection.
+
+        For PostgreSQL, MySQL and SQLite the layout follows get_table_schema()
+        with these differences: column types are the database's native type
+        strings rather than SQLAlchemy types, columns have no 'comment', foreign
+        keys have no 'referred_schema', and SQLite foreign keys are unnamed
+        (name None). These results are cached separately from
+        get_table_schema(), so neither call changes what the other returns.
+
+        Returns:
+            Dictionary mapping table name to its schema information
+
+        Raises:
+            DatabaseError: If unable to retrieve the schemas
+        """
+        bulk_introspectors = {
+            'postgresql': self._bulk_introspect_postgres,
+            'mysql': self._bulk_introspect_mysql,
+            'sqlite': self._bulk_introspect_sqlite,
+        }
+        bulk_introspect = bulk_introspectors.get(self._dialect_name)
+
+        # Per-table reflection produces exactly the get_table_schema() layout
+        # and shares its cache
+        schema_cache = self._schema_cache if bulk_introspect is None else self._bulk_schema_cache
+
+        cached_names = self._table_names_cache
+        if cached_names is not None and self._is_cache_fresh(cached_names[1]):
+            cached = {name: schema_cache.get(name) for name in cached_names[0]}
+            if all(entry is not None and self._is_cache_fresh(entry[1]) for entry in cached.values()):
+                return {name: entry[0] for name, entry in cached.items()}
+
+        if bulk_introspect is None:
+            return self._introspect_per_table(self.get_table_names())
+
         try:
             with self.get_connection() as conn:
-                inspector = inspect(conn)
+                schemas = bulk_introspect(conn)
 
-                # Get column information
-                columns = inspector.get_columns(table_name)
+            if self._schema_cache_ttl > 0:
+                fetched_at = time.time()
+                self._bulk_schema_cache.update((name, (info, fetched_at)) for name, info in schemas.items())
+                self._table_names_cache = (list(schemas), fetched_at)
 
-                # Get primary key information
-                pk_constraint = inspector.get_pk_constraint(table_name)
+            logger.debug("Retrieved schemas for %d tables in bulk", len(schemas))
+            return schemas
 
-                # Get foreign key information
-                foreign_keys = inspector.get_foreign_keys(table_name)
+        except Exception as err:
+            error_msg = f"Failed to retrieve database schemas: {err}"
+            logger.error(error_msg)
+            raise DatabaseError(error_msg) from err
+
+    def _introspect_per_table(self, table_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch schemas for dialects without a bulk catalog query.
+
+        All tables are reflected into the shared MetaData in a single
+        reflection pass on one connection, which SQLAlchemy batches per
+        dialect, and then read back from their Table objects.
+
+        Args:
+            table_names: Tables to introspect
+
+        Returns:
+            Dictionary mapping table name to its get_table_schema() result
+        """
+        self.refresh_metadata(table_names)
+
+        schemas = {name: self._schema_from_table(self._metadata.tables[name]) for name in table_names}
+        if self._schema_cache_ttl > 0:
+            fetched_at = time.time()
+            self._schema_cache.update((name, (info, fetched_at)) for name, info in schemas.items())
+
+        logger.debug("Retrieved schemas for %d tables via reflection", len(schemas))
+        return schemas
+
+    @staticmethod
+    def _empty_schema(table_name: str) -> Dict[str, Any]:
+        """Create an empty schema entry with the get_table_schema() layout."""
+        return {
+            'table_name': table_name,
+            'columns': [],
+            'primary_key': {'name': None, 'constrained_columns': []},
+            'foreign_keys': [],
+            'indexes': []
+        }
 
-                # Get index information
-                indexes = inspector.get_indexes(table_name)
+    def _group_bulk_rows(self, column_rows: Iterable[Any], key_rows: Iterable[Any],
+                         index_rows: Iterable[Any]) -> Dict[str, Dict[str, Any]]:
+        """Group normalized catalog rows by table name (see the *_SQL constants)."""
+        schemas: Dict[str, Dict[str, Any]] = {}
+
+        for table, column, data_type, is_nullable, default in column_rows:
+            schema = schemas.get(table) or schemas.setdefault(table, self._empty_schema(table))
+            schema['columns'].append({
+                'name': column,
+                'type': data_type,
+                'nullable': is_nullable == 'YES',
+                'default': default
+            })
+
+        foreign_keys: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for table, constraint, constraint_type, column, referred_table, referred_column in key_rows:
+            schema = schemas.get(table)
+            if schema is None:
+                continue
 
-                schema_info = {
-                    'table_name': table_name,
-                    'columns': columns,
-                    'primary_key': pk_constraint,
-                    'foreign_keys': foreign_keys,
-                    'indexes': indexes
+            if constraint_type == 'PRIMARY KEY':
+                schema['primary_key']['name'] = constraint
+                schema['primary_key']['constrained_columns'].append(column)
+            else:
+                fk = foreign_keys.get((table, constraint))
+                if fk is None:
+                    fk = foreign_keys[(table, constraint)] = {
+                        # SQLite foreign keys are unnamed and keyed by their PRAGMA id
+                        'name': constraint if isinstance(constraint, str) else None,
+                        'constrained_columns': [],
+                        'referred_table': referred_table,
+                        'referred_columns': []
+                    }
+                    schema['foreign_keys'].append(fk)
+                fk['constrained_columns'].append(column)
+                fk['referred_columns'].append(referred_column)
+
+        indexes: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for table, index_name, is_unique, column in index_rows:
+            schema = schemas.get(table)
+            if schema is None:
+                continue
+
+            index = indexes.get((table, index_name))
+            if index is None:
+                index = indexes[(table, index_name)] = {
+                    'name': index_name,
+                    'column_names': [],
+                    'unique': bool(is_unique)
                 }
+                schema['indexes'].append(index)
+            index['column_names'].append(column)
+
+        return schemas
+
+    def _bulk_introspect_postgres(self, conn) -> Dict[str, Dict[str, Any]]:
+        """Introspect all tables in the current PostgreSQL schema."""
+        return self._group_bulk_rows(
+            conn.execute(text(_POSTGRES_COLUMNS_SQL)).fetchall(),
+            conn.execute(text(_POSTGRES_KEYS_SQL)).fetchall(),
+            conn.execute(text(_POSTGRES_INDEXES_SQL)).fetchall()
+        )
+
+    def _bulk_introspect_mysql(self, conn) -> Dict[str, Dict[str, Any]]:
+        """Introspect all tables in the current MySQL database."""
+        return self._group_bulk_rows(
+            conn.execute(text(_MYSQL_COLUMNS_SQL)).fetchall(),
+            conn.execute(text(_MYSQL_KEYS_SQL)).fetchall(),
+            conn.execute(text(_MYSQL_INDEXES_SQL)).fetchall()
+        )
+
+    def _bulk_introspect_sqlite(self, conn) -> Dict[str, Dict[str, Any]]:
+        """Introspect all SQLite tables via PRAGMAs on a single connection."""
+        table_names = conn.execute(text(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
+        )).scalars().all()
+
+        column_rows, key_rows, index_rows = [], [], []
+        for table in table_names:
+            quoted = table.replace('"', '""')
+
+            pk_columns = []
+            for _, column, data_type, notnull, default, pk in conn.exec_driver_sql(f'PRAGMA table_info("{quoted}")'):
+                column_rows.append((table, column, data_type, 'NO' if notnull else 'YES', default))
+                if pk:
+                    pk_columns.append((pk, column))
+            for _, column in sorted(pk_columns):
+                key_rows.append((table, None, 'PRIMARY KEY', column, None, None))
+
+            for fk in conn.exec_driver_sql(f'PRAGMA foreign_key_list("{quoted}")'):
+                # (id, seq, table, from, to, on_update, on_delete, match)
+                key_rows.append((table, fk[0], 'FOREIGN KEY', fk[3], fk[2], fk[4]))
+
+            for index in conn.exec_driver_sql(f'PRAGMA index_list("{quoted}")').fetchall():
+                # (seq, name, unique, origin, partial); skip implicit pk/unique indexes
+                index_name, is_unique, origin = index[1], index[2], index[3]
+                if origin != 'c':
+                    continue
+                quoted_index = index_name.replace('"', '""')
+                for info in conn.exec_driver_sql(f'PRAGMA index_info("{quoted_index}")'):
+                    index_rows.append((table, index_name, is_unique, info[2]))
+
+        return self._group_bulk_rows(column_rows, key_rows, index_rows)
+
+    def get_table_rowcount(self, table_name: str, exact: bool = False) -> int:
+        """
+        Get the number of rows in a table.
+
+        By default PostgreSQL and MySQL answer from catalog statistics, which is
+        instant but approximate (as fresh as the last ANALYZE). SQLite, other
+        dialects, tables without statistics, and exact=True use COUNT(*).
+
+        Args:
+            table_name: Name of the table
+            exact: Force an exact COUNT(*) scan
+
+        Returns:
+            Row count (estimated unless exact=True)
+
+        Raises:
+            DatabaseError: If unable to count the rows
+        """
+        try:
+            with self.get_connection() as conn:
+                estimate_sql = None if exact else _ROWCOUNT_ESTIMATE_SQL.get(self._dialect_name)
+                if estimate_sql is not None:
+                    estimate = conn.execute(text(estimate_sql), {'table_name': table_name}).scalar()
+                    # PostgreSQL reports -1 for tables that have never been analyzed
+                    if estimate is not None and estimate >= 0:
+                        return int(estimate)
 
-                logger.debug(f"Retrieved schema for table: {table_name}")
-                return schema_info
+                quoted_table = self.engine.dialect.identifier_preparer.quote(table_name)
+                return int(conn.execute(text(f"SELECT COUNT(*) FROM {quoted_table}")).scalar())
 
         except Exception as err:
-            error_msg = f"Failed to retrieve schema for table '{table_name}': {err}"
+            error_msg = f"Failed to count rows for table '{table_name}': {err}"
             logger.error(error_msg)
             raise DatabaseError(error_msg) from err
 
-    def execute_query(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _check_query_allowed(query: str) -> None:
+        """
+        Reject empty and destructive queries before they reach the database.
+
+        Raises:
+            DatabaseQueryError: If the query is empty or destructive
+        """
+        # Scan past leading whitespace and read only the first keyword, so the
+        # (possibly multi-KB) query is never copied or case-folded as a whole
+        n = len(query)
+        i = 0
+        while i < n and query[i].isspace():
+            i += 1
+        if i == n:
+            raise DatabaseQueryError("Query cannot be empty")
+
+        j = i
+        while j < n and query[j].isalpha():
+            j += 1
+
+        # Security check - prevent destructive operations
+        first_token = query[i:j].upper()
+        if first_token in _DESTRUCTIVE_SET:
+            error_msg = f"Destructive SQL operations are not allowed: {first_token}"
+            logger.warning("Blocked destructive query: %.100s...", query)
+            raise DatabaseQueryError(error_msg)
+
+    def execute_query(self, query: str, parameters: Optional[Dict[str, Any]] = None,
+                      limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Execute a SQL query and return results.
 
+        Rows are streamed from a server-side cursor (PostgreSQL, MySQL) in
+        batches of _STREAM_BATCH_SIZE rather than buffered with fetchall(),
+        so passing a limit stops reading once enough rows have arrived.
+
+        Statements are memoized by their SQL text, so values should be passed
+        through parameters (bound) rather than inlined into the query string
+        to let repeated queries reuse the cached statement and database plan.
+
         Args:
             query: SQL query string
             parameters: Optional query parameters
+            limit: Optional maximum number of rows to return
 
         Returns:
             List of dictionaries representing query results
@@ -335,36 +1030,28 @@ class DatabaseService:
         Raises:
             DatabaseQueryError: If query execution fails
         """
-        if not query.strip():
-            raise DatabaseQueryError("Query cannot be empty")
-
-        # Security check - prevent destructive operations
-        query_upper = query.upper().strip()
-        destructive_keywords = ['DROP', 'DELETE', 'UPDATE', 'INSERT', 'ALTER', 'CREATE', 'TRUNCATE']
-
-        for keyword in destructive_keywords:
-            if query_upper.startswith(keyword):
-                error_msg = f"Destructive SQL operations are not allowed: {keyword}"
-                logger.warning(f"Blocked destructive query: {query[:100]}...")
-                raise DatabaseQueryError(error_msg)
+        self._check_query_allowed(query)
 
         try:
             with self.get_connection() as conn:
-                logger.debug(f"Executing query: {query[:100]}{'...' if len(query) > 100 else ''}")
+                logger.debug("Executing query: %.100s%s", query, "..." if len(query) > 100 else "")
+
+                # Stream rows instead of buffering the whole result set
+                conn = conn.execution_options(stream_results=True, max_row_buffer=_STREAM_BATCH_SIZE)
 
                 # Execute query with optional parameters
                 if parameters:
-                    custom_result = conn.execute(text(query), parameters)
+                    custom_result = conn.execute(_compile(query), parameters)
                 else:
-                    custom_result = conn.execute(text(query))
+                    custom_result = conn.execute(_compile(query))
 
                 # Convert results to list of dictionaries
-                rows = custom_result.fetchall()
-                column_names = custom_result.keys()
+                rows = custom_result.mappings()
+                if limit is not None:
+                    rows = islice(rows, limit)
+                results = [dict(row) for row in rows]
 
-                results = [dict(zip(column_names, row)) for row in rows]
-
-                logger.info(f"Query executed successfully, returned {len(results)} rows")
+                logger.info("Query executed successfully, returned %d rows", len(results))
                 return results
 
         except SQLAlchemyError as err:
@@ -377,27 +1064,91 @@ class DatabaseService:
             logger.error(error_msg)
             raise DatabaseQueryError(error_msg) from err
 
+    def execute_queries(self, queries: List[str]) -> List[List[Dict[str, Any]]]:
+        """
+        Execute several read-only queries on one connection and transaction.
+
+        Every query is checked against the destructive-operation guard before
+        any of them is sent, so a rejected statement aborts the whole batch.
+        Sharing the connection avoids a pool checkout and transaction
+        round-trip per query.
+
+        Args:
+            queries: SQL query strings to run in order
+
+        Returns:
+            One list of row dictionaries per query, in the same order
+
+        Raises:
+            DatabaseQueryError: If any query is rejected or fails to execute
+        """
+        for query in queries:
+            self._check_query_allowed(query)
+
+        if not queries:
+            return []
+
+        try:
+            with self.get_connection() as conn:
+                with conn.begin():
+                    result_sets = [
+                        [dict(row) for row in conn.execute(_compile(query)).mappings().all()]
+                        for query in queries
+                    ]
+
+                logger.info("Executed %d queries in one transaction", len(result_sets))
+                return result_sets
+
+        except SQLAlchemyError as err:
+            error_msg = f"SQL execution error: {err}"
+            logger.error(error_msg)
+            raise DatabaseQueryError(error_msg) from err
+
+        except Exception as err:
+            error_msg = f"Unexpected error during query execution: {err}"
+            logger.error(error_msg)
+            raise DatabaseQueryError(error_msg) from err
+
     def get_database_info(self) -> Dict[str, Any]:
         """
         Get comprehensive database information.
 
+        The liveness probe and table listing share a single pooled connection.
+
         Returns:
             Dictionary with database metadata
         """
         try:
             db_info = {
-                'database_type': self.engine.dialect.name if self.engine else None,
-                'database_uri': _mask_uri(self.config.DATABASE_URI),
+                'database_type': self._dialect_name,
+                'database_uri': self._masked_uri,
                 'total_tables': 0,
-                'table_names': [],
-                'health_status': self.get_health_status()
+                'table_names': []
             }
 
-            if self.test_connection():
-                table_names = self.get_table_names()
+            try:
+                with self.get_connection() as conn:
+                    conn.execute(text("SELECT 1")).fetchone()
+                    self._last_health_check = time.time()
+                    self._cached_healthy = True
+
+                    cached_names = self._table_names_cache
+                    if cached_names is not None and self._is_cache_fresh(cached_names[1]):
+                        table_names = list(cached_names[0])
+                    else:
+                        table_names = inspect(conn).get_table_names()
+                        if self._schema_cache_ttl > 0:
+                            self._table_names_cache = (table_names, time.time())
+                        table_names = list(table_names)
+
                 db_info['total_tables'] = len(table_names)
                 db_info['table_names'] = table_names
 
+            except DatabaseError as err:
+                log_exception(logger, err, "database info connection")
+                self._cached_healthy = False
+
+            db_info['health_status'] = self.get_health_status()
             return db_info
 
         except Exception as err:
@@ -406,10 +1157,17 @@ class DatabaseService:
 
     def close(self) -> None:
         """Close database engine and cleanup resources."""
+        self._health_stop.set()
+        self._cached_healthy = False
+
         if self.engine:
             logger.info("Closing database engine")
             self.engine.dispose()
             self.engine = None
+            self._dialect_name = None
+            self._pool_class_name = None
+            self.invalidate_schema_cache()
+            self._metadata = None
             logger.info("Database engine closed successfully")
 
     def __enter__(self):
@@ -422,8 +1180,9 @@ class DatabaseService:
 
     def __repr__(self) -> str:
         """String representation of database service."""
-        db_type = self.engine.dialect.name if self.engine else 'Unknown'
-        return f"DatabaseService(type={db_type}, connected={self.test_connection()})"
+        db_type = self._dialect_name or 'Unknown'
+        # Never touch the database here; repr is used in log lines
+        return f"DatabaseService(type={db_type}, connected={self._cached_healthy})"
 
 
 def create_database_service(custom_config: Optional[Config] = None) -> DatabaseService:
@@ -12,6 +12,10 @@ Features:
 - LLM health checks and connectivity testing
 - Centralized error handling and retry logic
 - Token usage monitoring and rate limiting awareness
+- Response caching for deterministic (temperature 0) prompts
+- Optional semantic caching of responses to paraphrased prompts
+- Async generation (agenerate_response, abatch_generate) for event-loop callers
+- Token streaming (stream_response, astream_response) for low first-token latency
 - Model availability and capability testing
 
 Usage:
@@ -27,18 +31,111 @@ Usage:
         print(f"LLM Response: {response}")
 """
 
+import asyncio
+import hashlib
+import json
+import re
+import threading
 import time
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from datetime import datetime
+from types import MappingProxyType
+from typing import Dict, Any, AsyncIterator, Iterator, List, Mapping, Optional, Tuple, TYPE_CHECKING
 
 from backend.app.config import Config
 from backend.app.utils.logger import get_logger, log_exception
-from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
+from backend.app.utils.semantic_cache import SemanticCache
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from tenacity import (AsyncRetrying, Retrying, retry_if_exception_type, stop_after_attempt,
+                      wait_exponential_jitter)
+
+if TYPE_CHECKING:
+    # The Google client stack is slow to import, so only load it when the LLM is created
+    from langchain_google_genai import ChatGoogleGenerativeAI
 
 # Initialize logger for this module
 logger = get_logger(__name__)
 
+# Client error classification, matched in one pass over the error message
+_ERR_RE = re.compile(r"(?P<rate>rate limit|quota|resource (?:has been )?exhausted)"
+                     r"|(?P<timeout>timeout|timed out|deadline exceeded)"
+                     r"|(?P<auth>api_key|authentication)"
+                     r"|(?P<unavailable>\b50[0234]\b|unavailable|overloaded|internal error"
+                     r"|connection (?:reset|refused|aborted|error))",
+                     re.IGNORECASE)
+
+# Request counters reset after this many seconds
+_RATE_LIMIT_WINDOW = 3600
+
+# Distinct system prompts whose SystemMessage objects are kept for reuse
+_SYSTEM_MESSAGE_CACHE_SIZE = 16
+
+# Minimal request used for connectivity tests
+_TEST_PROMPT = "Respond with just the word 'OK'"
+
+_VALID_MODELS = frozenset({
+    'gemini-2.5-pro',
+    'gemini-2.5-flash',
+    'gemini-2.5-flash-lite-preview-06-17',
+
+    'gemini-2.0-flash',
+    'gemini-2.0-flash-lite',
+
+    'gemini-1.5-pro-latest',
+    'gemini-1.5-flash-latest',
+
+    'gemini-1.5-pro',
+    'gemini-1.5-flash',
+
+    # Older generation model for backward compatibility
+    'gemini-pro'
+})
+
+_SQL_INJECTION_PATTERNS = (
+    'drop table', 'delete from', 'update set', 'insert into',
+    'alter table', 'create table', 'truncate', '--', ';'
+)
+
+_COMPLEXITY_INDICATORS = (
+    'join', 'group by', 'order by', 'having', 'subquery',
+    'aggregate', 'sum', 'count', 'average', 'max', 'min'
+)
+
+# Prompt analysis patterns for validate_prompt_for_sql, each matched in one pass
+_SQL_INJECTION_RE = re.compile('|'.join(map(re.escape, _SQL_INJECTION_PATTERNS)), re.IGNORECASE)
+_COMPLEXITY_RE = re.compile(r"\b(" + '|'.join(map(re.escape, _COMPLEXITY_INDICATORS)) + r")\b", re.IGNORECASE)
+_LISTING_RE = re.compile(r"show|list", re.IGNORECASE)
+
+
+def _build_prompt_automaton():
+    """Build an Aho-Corasick automaton over all prompt analysis tokens, if available."""
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for token in _SQL_INJECTION_PATTERNS:
+        automaton.add_word(token, ('injection', token))
+    for token in _COMPLEXITY_INDICATORS:
+        automaton.add_word(token, ('complexity', token))
+    automaton.make_automaton()
+    return automaton
+
+
+# Single-pass matcher for all tokens (optional pyahocorasick); regexes are the fallback
+_PROMPT_AUTOMATON = _build_prompt_automaton()
+
+
+def _is_word_char(char: str) -> bool:
+    """Match the regex definition of a word character (used for word boundaries)."""
+    return char.isalnum() or char == '_'
+
+
+def _to_iso(timestamp: Optional[float]) -> Optional[str]:
+    """Format an epoch timestamp as an ISO 8601 string for reporting."""
+    return datetime.fromtimestamp(timestamp).isoformat() if timestamp else None
+
 
 class LLMError(Exception):
     """Base exception for LLM-related errors."""
@@ -65,6 +162,101 @@ class LLMTimeoutError(LLMError):
     pass
 
 
+class LLMUnavailableError(LLMError):
+    """Exception raised when the LLM service is temporarily unavailable (5xx, network errors)."""
+    pass
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket for client-side request throttling.
+
+    Tokens refill continuously at `rate` per second up to `capacity`. After a
+    server-side rate limit, penalize() halves the refill rate; once the
+    penalty window has passed the rate grows back in steps of a tenth of the
+    base rate (additive increase, multiplicative decrease).
+    """
+
+    def __init__(self, rate: float, capacity: float, penalty_seconds: float = 60.0):
+        """
+        Initialize the token bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of stored tokens (burst size)
+            penalty_seconds: How long a halved rate is kept after penalize()
+        """
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.penalty_seconds = penalty_seconds
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._penalty_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add tokens for the elapsed time. Caller must hold the lock."""
+        if self.rate < self.base_rate and now >= self._penalty_until:
+            self.rate = min(self.base_rate, self.rate + self.base_rate / 10)
+            self._penalty_until = now + self.penalty_seconds / 10
+
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def _try_take(self, tokens: int) -> float:
+        """Take tokens if available; otherwise return the seconds until they are."""
+        with self._lock:
+            self._refill(time.monotonic())
+            # A request larger than the bucket only waits for a full bucket
+            needed = min(tokens, self.capacity)
+            if self._tokens >= needed:
+                self._tokens -= needed
+                return 0.0
+            return (needed - self._tokens) / self.rate
+
+    def acquire(self, timeout: float, tokens: int = 1) -> bool:
+        """
+        Block until tokens are available.
+
+        Args:
+            timeout: Maximum seconds to wait
+            tokens: Number of tokens to take
+
+        Returns:
+            True if the tokens were taken, False if they would not be
+            available within the timeout (returns immediately in that case)
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            wait = self._try_take(tokens)
+            if not wait:
+                return True
+            if time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    async def aacquire(self, timeout: float, tokens: int = 1) -> bool:
+        """Async variant of acquire() that sleeps without blocking the event loop."""
+        deadline = time.monotonic() + timeout
+        while True:
+            wait = self._try_take(tokens)
+            if not wait:
+                return True
+            if time.monotonic() + wait > deadline:
+                return False
+            await asyncio.sleep(wait)
+
+    def penalize(self) -> None:
+        """Halve the refill rate after the server reported a rate limit."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.base_rate / 16, self.rate / 2)
+            self._penalty_until = now + self.penalty_seconds
+            logger.debug(f"Token bucket rate reduced to {self.rate * 60:.1f} requests/minute")
+
+
 class LLMService:
     """
     LLM service that manages Google Gemini interactions and operations.
@@ -73,27 +265,80 @@ class LLMService:
     handling authentication, rate limiting, error recovery, and health monitoring.
     """
 
-    def __init__(self, custom_config: Config):
+    def __init__(self, custom_config: Config, verify_on_init: bool = False):
         """
         Initialize the LLM service.
 
         Args:
             custom_config: Application configuration instance
+            verify_on_init: If True, make a test request before returning.
+                Otherwise the connection is verified by the first successful
+                request.
         """
         self.config = custom_config
-        self.llm: Optional[ChatGoogleGenerativeAI] = None
+        self.llm: Optional["ChatGoogleGenerativeAI"] = None
+        self._verified = False
+        self._healthy = False
         self._last_health_check: Optional[float] = None
         self._health_check_interval = 300  # 5 minutes
-        self._rate_limit_reset: Optional[datetime] = None
+        self._stop_event = threading.Event()
+        self._health_thread: Optional[threading.Thread] = None
+        self._rate_limit_reset: Optional[float] = None
         self._request_count = 0
-        self._last_request_time: Optional[datetime] = None
+        self._last_request_time: Optional[float] = None
+
+        # Exact-match response cache: key -> (response_text, stored_at)
+        self._response_cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+        self._response_cache_size = self.config.LLM_RESPONSE_CACHE_SIZE
+        self._response_cache_ttl = self.config.LLM_RESPONSE_CACHE_TTL
+        # Hit and miss counters are guarded by _response_cache_lock
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._semantic_cache: Optional[SemanticCache] = None
+        if self.config.SEMANTIC_CACHE_ENABLED:
+            self._semantic_cache = SemanticCache(
+                threshold=self.config.SEMANTIC_CACHE_THRESHOLD,
+                max_entries=self.config.SEMANTIC_CACHE_MAX_ENTRIES,
+                ttl=self._response_cache_ttl,
+                model_name=self.config.SEMANTIC_CACHE_MODEL
+            )
+        self._semantic_cache_hits = 0
+
+        # Client-side request throttle (None when LLM_RPM is 0)
+        rpm = self.config.LLM_RPM
+        self._token_bucket: Optional[TokenBucket] = TokenBucket(rate=rpm / 60, capacity=rpm) if rpm else None
+
+        # System prompts are usually a handful of constants; reuse their messages
+        self._system_message_cache: "OrderedDict[str, SystemMessage]" = OrderedDict()
+        self._system_message_lock = threading.Lock()
 
         logger.info("Initializing LLMService")
         self._validate_configuration()
+        self._model_info = self._build_model_info()
         self._initialize_llm()
-        self._verify_connection()
+        if verify_on_init:
+            self._verify_connection()
+        self._start_health_monitor()
         logger.info("LLMService initialized successfully")
 
+    def _start_health_monitor(self) -> None:
+        """Start a daemon thread that refreshes the cached health status periodically."""
+        self._health_thread = threading.Thread(
+            target=self._health_monitor_loop,
+            name="llm-health-monitor",
+            daemon=True
+        )
+        self._health_thread.start()
+
+    def _health_monitor_loop(self) -> None:
+        """Probe the LLM every health check interval until the service is closed."""
+        # Sleep first: probing at startup would spend quota that verify_on_init=False opts out of
+        while not self._stop_event.wait(self._health_check_interval):
+            # Recent successful requests already prove the API is reachable
+            if not self._last_health_check or time.time() - self._last_health_check >= self._health_check_interval:
+                self.test_connection()
+
     def _validate_configuration(self) -> None:
         """Validate LLM configuration parameters."""
         try:
@@ -110,27 +355,9 @@ class LLMService:
 
             # Validate model name
             model_name = self.config.GEMINI_MODEL_NAME
-            valid_models = [
-                'gemini-2.5-pro',
-                'gemini-2.5-flash',
-                'gemini-2.5-flash-lite-preview-06-17',
-
-                'gemini-2.0-flash',
-                'gemini-2.0-flash-lite',
-
-                'gemini-1.5-pro-latest',
-                'gemini-1.5-flash-latest',
-
-                'gemini-1.5-pro',
-                'gemini-1.5-flash',
-
-                # Older generation model for backward compatibility
-                'gemini-pro'
-            ]
-
-            if model_name not in valid_models:
+            if model_name not in _VALID_MODELS:
                 logger.warning(f"Model '{model_name}' may not be supported. "
-                               f"Supported models: {', '.join(valid_models)}")
+                               f"Supported models: {', '.join(sorted(_VALID_MODELS))}")
 
             # Validate temperature
             temp = self.config.LLM_TEMPERATURE
@@ -156,13 +383,18 @@ class LLMService:
         try:
             logger.info(f"Initializing Gemini model: {self.config.GEMINI_MODEL_NAME}")
 
-            # Create LLM instance with configuration
+            from langchain_google_genai import ChatGoogleGenerativeAI
+
+            # Create LLM instance with configuration. The instance builds its
+            # API client once, so keeping it for the service lifetime reuses
+            # the underlying gRPC channel / HTTP session across calls.
             self.llm = ChatGoogleGenerativeAI(
                 model=self.config.GEMINI_MODEL_NAME,
                 temperature=self.config.LLM_TEMPERATURE,
                 max_retries=self.config.LLM_MAX_RETRIES,
                 timeout=self.config.LLM_TIMEOUT,
-                google_api_key=self.config.GOOGLE_API_KEY
+                google_api_key=self.config.GOOGLE_API_KEY,
+                transport=self.config.LLM_TRANSPORT
             )
 
             logger.info("Gemini LLM instance created successfully")
@@ -192,40 +424,82 @@ class LLMService:
             logger.debug("Testing LLM connection")
 
             # Simple test message
-            test_message = HumanMessage(content="Respond with just the word 'OK'")
+            test_message = HumanMessage(content=_TEST_PROMPT)
 
             # Make test request with shorter timeout
             start_time = time.time()
             llm_response = self.llm.invoke([test_message])
-            end_time = time.time()
+            return self._check_test_response(llm_response, start_time)
 
-            response_time = end_time - start_time
-            logger.debug(f"LLM connection test successful (response time: {response_time:.2f}s)")
+        except Exception as err:
+            log_exception(logger, err, "LLM connection test")
+            self._healthy = False
+            return False
 
-            # Update health check timestamp
-            self._last_health_check = time.time()
+    async def atest_connection(self) -> bool:
+        """
+        Test LLM connectivity with a simple request without blocking the event loop.
 
-            # Check if response is reasonable
-            if hasattr(llm_response, 'content') and llm_response.content:
-                logger.debug(f"Test response: {llm_response.content[:50]}")
-                return True
-            else:
-                logger.warning("LLM test response was empty or invalid")
+        Returns:
+            True if connection successful, False otherwise
+        """
+        try:
+            if not self.llm:
+                logger.error("LLM instance not initialized")
                 return False
 
+            logger.debug("Testing LLM connection (async)")
+
+            start_time = time.time()
+            llm_response = await self.llm.ainvoke([HumanMessage(content=_TEST_PROMPT)])
+            return self._check_test_response(llm_response, start_time)
+
         except Exception as err:
             log_exception(logger, err, "LLM connection test")
+            self._healthy = False
             return False
 
+    def _check_test_response(self, llm_response: Any, start_time: float) -> bool:
+        """Record a connection test result and check that the response is usable."""
+        response_time = time.time() - start_time
+        logger.debug(f"LLM connection test successful (response time: {response_time:.2f}s)")
+
+        # Update health check timestamp
+        self._last_health_check = time.time()
+
+        # Check if response is reasonable
+        if hasattr(llm_response, 'content') and llm_response.content:
+            logger.debug(f"Test response: {llm_response.content[:50]}")
+            self._mark_healthy()
+            return True
+        else:
+            logger.warning("LLM test response was empty or invalid")
+            self._healthy = False
+            return False
+
+    def _mark_healthy(self) -> None:
+        """Record that the API just answered a request successfully."""
+        self._verified = True
+        self._healthy = True
+
     def generate_response(self, prompt: str, system_prompt: Optional[str] = None,
-                          max_tokens: Optional[int] = None) -> str:
+                          max_tokens: Optional[int] = None, context: Optional[str] = None) -> str:
         """
         Generate a response from the LLM.
 
+        Keep system_prompt identical across calls and pass per-call data
+        (schema snippets, retrieved rows, conversation state) as context.
+        The context goes into the user message, after the system prompt,
+        so the request prefix stays stable and Gemini's implicit prompt
+        caching can reuse it.
+
         Args:
             prompt: User prompt/question
-            system_prompt: Optional system instruction
+            system_prompt: Optional static system instruction; never
+                interpolate per-call data into it
             max_tokens: Optional maximum tokens limit
+            context: Optional per-call context placed before the prompt in
+                the user message
 
         Returns:
             Generated response text
@@ -233,85 +507,534 @@ class LLMService:
         Raises:
             LLMError: If response generation fails
         """
-        if not self.llm:
-            raise LLMConnectionError("LLM instance not initialized")
+        self._check_prompt(prompt)
+        prompt = self._with_context(prompt, context)
 
-        if not prompt.strip():
-            raise LLMError("Prompt cannot be empty")
+        cached_response, cache_key = self._lookup_caches(prompt, system_prompt, max_tokens)
+        if cached_response is not None:
+            return cached_response
+
+        self._throttle()
 
         try:
             # Track request for rate limiting awareness
             self._update_request_tracking()
 
-            # Prepare messages
-            messages = []
-
-            if system_prompt:
-                messages.append(SystemMessage(content=system_prompt))
-            else:
-                messages.append(HumanMessage(content=prompt))
+            messages = self._build_messages(prompt, system_prompt)
 
             logger.debug(f"Generating LLM response for prompt: {prompt[:100]}{'...' if len(prompt) > 100 else ''}")
 
             start_time = time.time()
 
             # Generate response
-            llm_response = self.llm.invoke(messages)
+            llm_response = self._invoke(messages)
 
-            end_time = time.time()
-            response_time = end_time - start_time
+            response_time = time.time() - start_time
+            response_text = self._extract_response_text(llm_response)
+            self._mark_healthy()
 
-            # Extract response content
-            if hasattr(llm_response, 'content'):
-                response_text = llm_response.content.strip()
-            else:
-                response_text = str(llm_response).strip()
+            logger.info(f"LLM response generated successfully (time: {response_time:.2f}s, "
+                        f"length: {len(response_text)} chars)")
+
+            self._remember_response(cache_key, prompt, system_prompt, max_tokens, response_text)
+            return response_text
+
+        except LLMError:
+            raise
+
+        except Exception as err:
+            raise self._translate_error(err) from err
+
+    async def agenerate_response(self, prompt: str, system_prompt: Optional[str] = None,
+                                 max_tokens: Optional[int] = None, context: Optional[str] = None) -> str:
+        """
+        Generate a response from the LLM without blocking the event loop.
+
+        See generate_response() for how system_prompt and context are used.
+
+        Args:
+            prompt: User prompt/question
+            system_prompt: Optional static system instruction
+            max_tokens: Optional maximum tokens limit
+            context: Optional per-call context placed before the prompt in
+                the user message
+
+        Returns:
+            Generated response text
+
+        Raises:
+            LLMError: If response generation fails
+        """
+        self._check_prompt(prompt)
+        prompt = self._with_context(prompt, context)
+
+        cached_response, cache_key = self._lookup_caches(prompt, system_prompt, max_tokens)
+        if cached_response is not None:
+            return cached_response
+
+        await self._athrottle()
+
+        try:
+            self._update_request_tracking()
+
+            messages = self._build_messages(prompt, system_prompt)
+
+            logger.debug(f"Generating async LLM response for prompt: {prompt[:100]}{'...' if len(prompt) > 100 else ''}")
+
+            start_time = time.time()
+            llm_response = await self._ainvoke(messages)
+            response_time = time.time() - start_time
+
+            response_text = self._extract_response_text(llm_response)
+            self._mark_healthy()
 
             logger.info(f"LLM response generated successfully (time: {response_time:.2f}s, "
                         f"length: {len(response_text)} chars)")
 
+            self._remember_response(cache_key, prompt, system_prompt, max_tokens, response_text)
             return response_text
 
+        except LLMError:
+            raise
+
         except Exception as err:
-            # Handle specific error types
-            error_msg = str(err).lower()
+            raise self._translate_error(err) from err
+
+    def _retrying_kwargs(self) -> Dict[str, Any]:
+        """Retry policy for transient failures: rate limits, timeouts and server/network errors."""
+        return {
+            'stop': stop_after_attempt(self.config.LLM_MAX_RETRIES + 1),
+            'wait': wait_exponential_jitter(initial=0.5, max=8),
+            'retry': retry_if_exception_type((LLMRateLimitError, LLMTimeoutError, LLMUnavailableError)),
+            'before_sleep': lambda retry_state: logger.warning(
+                f"Retrying LLM request after attempt {retry_state.attempt_number}: {retry_state.outcome.exception()}"
+            ),
+            'reraise': True,
+        }
 
-            if 'rate limit' in error_msg or 'quota' in error_msg:
-                self._handle_rate_limit_error(err)
-                raise LLMRateLimitError(f"API rate limit exceeded: {err}") from err
+    def _invoke(self, messages: List[BaseMessage]) -> Any:
+        """
+        Invoke the LLM, retrying rate limits, timeouts and 5xx/network errors
+        with jittered backoff.
 
-            elif 'timeout' in error_msg:
-                raise LLMTimeoutError(f"LLM request timeout: {err}") from err
+        Retries draw from the token bucket again, so after a rate limit they
+        are paced by its reduced refill rate. The client's own retries are
+        turned off for these calls so attempts do not multiply; they still
+        apply to the agent, which calls the client directly.
 
-            elif 'api_key' in error_msg or 'authentication' in error_msg:
-                raise LLMConnectionError(f"LLM authentication error: {err}") from err
+        Raises:
+            LLMError: The classified error once retries are exhausted
+        """
+        for attempt in Retrying(**self._retrying_kwargs()):
+            with attempt:
+                if attempt.retry_state.attempt_number > 1:
+                    self._throttle()
+                try:
+                    return self.llm.invoke(messages, max_retries=0)
+                except Exception as err:
+                    raise self._translate_error(err) from err
 
-            else:
-                error_msg = f"LLM response generation failed: {err}"
-                logger.error(error_msg)
-                raise LLMError(error_msg) from err
+    async def _ainvoke(self, messages: List[BaseMessage]) -> Any:
+        """
+        Async variant of _invoke().
+
+        Raises:
+            LLMError: The classified error once retries are exhausted
+        """
+        async for attempt in AsyncRetrying(**self._retrying_kwargs()):
+            with attempt:
+                if attempt.retry_state.attempt_number > 1:
+                    await self._athrottle()
+                try:
+                    return await self.llm.ainvoke(messages, max_retries=0)
+                except Exception as err:
+                    raise self._translate_error(err) from err
+
+    async def abatch_generate(self, prompts: List[str], system_prompt: Optional[str] = None) -> List[str]:
+        """
+        Generate responses for several prompts concurrently.
+
+        At most LLM_MAX_CONCURRENCY requests are in flight at once.
+
+        Args:
+            prompts: User prompts to answer
+            system_prompt: Optional system instruction shared by all prompts
+
+        Returns:
+            Response texts in the same order as the prompts
+
+        Raises:
+            LLMError: If any response generation fails
+        """
+        # Created per call so the semaphore belongs to the running event loop
+        semaphore = asyncio.Semaphore(self.config.LLM_MAX_CONCURRENCY)
+
+        async def _generate(prompt: str) -> str:
+            async with semaphore:
+                return await self.agenerate_response(prompt, system_prompt=system_prompt)
+
+        return list(await asyncio.gather(*(_generate(prompt) for prompt in prompts)))
+
+    def stream_response(self, prompt: str, system_prompt: Optional[str] = None) -> Iterator[str]:
+        """
+        Generate a response from the LLM, yielding text chunks as they arrive.
+
+        A cached response is yielded as a single chunk. The complete text is
+        added to the response caches once the stream finishes.
+
+        Args:
+            prompt: User prompt/question
+            system_prompt: Optional system instruction
+
+        Yields:
+            Response text chunks
+
+        Raises:
+            LLMError: If response generation fails
+        """
+        self._check_prompt(prompt)
+
+        cached_response, cache_key = self._lookup_caches(prompt, system_prompt, None)
+        if cached_response is not None:
+            yield cached_response
+            return
+
+        self._throttle()
+
+        try:
+            self._update_request_tracking()
+            messages = self._build_messages(prompt, system_prompt)
+
+            start_time = time.time()
+            chunks = []
+            for chunk in self.llm.stream(messages):
+                if chunk.content:
+                    chunks.append(chunk.content)
+                    yield chunk.content
+            self._mark_healthy()
+
+        except Exception as err:
+            raise self._translate_error(err) from err
+
+        response_text = ''.join(chunks).strip()
+        logger.info(f"LLM response streamed successfully (time: {time.time() - start_time:.2f}s, "
+                    f"length: {len(response_text)} chars)")
+        self._remember_response(cache_key, prompt, system_prompt, None, response_text)
+
+    async def astream_response(self, prompt: str, system_prompt: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        Async variant of stream_response() that does not block the event loop.
+
+        Args:
+            prompt: User prompt/question
+            system_prompt: Optional system instruction
+
+        Yields:
+            Response text chunks
+
+        Raises:
+            LLMError: If response generation fails
+        """
+        self._check_prompt(prompt)
+
+        cached_response, cache_key = self._lookup_caches(prompt, system_prompt, None)
+        if cached_response is not None:
+            yield cached_response
+            return
+
+        await self._athrottle()
+
+        try:
+            self._update_request_tracking()
+            messages = self._build_messages(prompt, system_prompt)
+
+            start_time = time.time()
+            chunks = []
+            async for chunk in self.llm.astream(messages):
+                if chunk.content:
+                    chunks.append(chunk.content)
+                    yield chunk.content
+            self._mark_healthy()
+
+        except Exception as err:
+            raise self._translate_error(err) from err
+
+        response_text = ''.join(chunks).strip()
+        logger.info(f"LLM response streamed successfully (time: {time.time() - start_time:.2f}s, "
+                    f"length: {len(response_text)} chars)")
+        self._remember_response(cache_key, prompt, system_prompt, None, response_text)
+
+    def generate_responses(self, prompts: List[str], system_prompt: Optional[str] = None) -> List[str]:
+        """
+        Generate responses for several prompts with one batched LLM call.
+
+        Cached prompts are answered from the cache; the rest are sent through
+        llm.batch(), which runs up to LLM_MAX_CONCURRENCY requests concurrently.
+
+        Args:
+            prompts: User prompts to answer
+            system_prompt: Optional system instruction shared by all prompts
+
+        Returns:
+            Response texts in the same order as the prompts
+
+        Raises:
+            LLMError: If response generation fails
+        """
+        for prompt in prompts:
+            self._check_prompt(prompt)
+
+        responses: List[Optional[str]] = []
+        pending = []  # (index, prompt, cache_key) for prompts that need a request
+        for index, prompt in enumerate(prompts):
+            cached_response, cache_key = self._lookup_caches(prompt, system_prompt, None)
+            responses.append(cached_response)
+            if cached_response is None:
+                pending.append((index, prompt, cache_key))
+
+        if not pending:
+            return responses
+
+        self._throttle(len(pending))
+
+        try:
+            self._update_request_tracking(len(pending))
+
+            logger.debug(f"Generating {len(pending)} LLM responses in a batch")
+
+            start_time = time.time()
+            llm_responses = self.llm.batch(
+                [self._build_messages(prompt, system_prompt) for _, prompt, _ in pending],
+                config={'max_concurrency': self.config.LLM_MAX_CONCURRENCY}
+            )
+            response_time = time.time() - start_time
+            self._mark_healthy()
+
+            logger.info(f"Generated {len(pending)} LLM responses in batch (time: {response_time:.2f}s)")
+
+        except Exception as err:
+            raise self._translate_error(err) from err
+
+        for (index, prompt, cache_key), llm_response in zip(pending, llm_responses):
+            response_text = self._extract_response_text(llm_response)
+            self._remember_response(cache_key, prompt, system_prompt, None, response_text)
+            responses[index] = response_text
+
+        return responses
+
+    @staticmethod
+    def _with_context(prompt: str, context: Optional[str]) -> str:
+        """Combine per-call context and the prompt into the user message text."""
+        return f"{context}\n\n{prompt}" if context else prompt
+
+    def _check_prompt(self, prompt: str) -> None:
+        """Ensure the LLM is ready and the prompt is not empty."""
+        if not self.llm:
+            raise LLMConnectionError("LLM instance not initialized")
+
+        if not prompt.strip():
+            raise LLMError("Prompt cannot be empty")
+
+    def _lookup_caches(self, prompt: str, system_prompt: Optional[str],
+                       max_tokens: Optional[int]) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Look for a cached response in the exact-match and semantic caches.
+
+        Returns:
+            Tuple of (cached response or None, exact-match cache key or None
+            when caching does not apply)
+        """
+        cache_key = None
+        if self._is_response_cache_enabled():
+            cache_key = self._response_cache_key(prompt, system_prompt, max_tokens)
+            cached_response = self._get_cached_response(cache_key)
+            if cached_response is not None:
+                logger.debug("Returning cached LLM response")
+                return cached_response, cache_key
+
+        return self._lookup_semantic_cache(prompt, system_prompt, max_tokens), cache_key
+
+    def _remember_response(self, cache_key: Optional[str], prompt: str, system_prompt: Optional[str],
+                           max_tokens: Optional[int], response_text: str) -> None:
+        """Store a fresh response in the enabled caches."""
+        if cache_key is not None:
+            self._store_cached_response(cache_key, response_text)
+        if self._is_semantic_cache_enabled():
+            self._semantic_cache.store(prompt, response_text, scope=(system_prompt, max_tokens))
+
+    def _build_messages(self, prompt: str, system_prompt: Optional[str]) -> List[BaseMessage]:
+        """Build the chat messages sent for a prompt."""
+        messages = []
+
+        if system_prompt:
+            messages.append(self._get_system_message(system_prompt))
+        messages.append(HumanMessage(content=prompt))
+
+        return messages
+
+    def _get_system_message(self, system_prompt: str) -> SystemMessage:
+        """Return a SystemMessage for the prompt, reusing recently built ones."""
+        with self._system_message_lock:
+            system_message = self._system_message_cache.get(system_prompt)
+            if system_message is not None:
+                self._system_message_cache.move_to_end(system_prompt)
+                return system_message
+
+            system_message = SystemMessage(content=system_prompt)
+            self._system_message_cache[system_prompt] = system_message
+            if len(self._system_message_cache) > _SYSTEM_MESSAGE_CACHE_SIZE:
+                self._system_message_cache.popitem(last=False)
+            return system_message
+
+    @staticmethod
+    def _extract_response_text(llm_response: Any) -> str:
+        """Extract the stripped text content from an LLM response."""
+        if hasattr(llm_response, 'content'):
+            return llm_response.content.strip()
+        return str(llm_response).strip()
+
+    def _translate_error(self, err: Exception) -> LLMError:
+        """
+        Map an exception raised by the LLM client to the matching LLMError.
+
+        Args:
+            err: Exception raised while generating a response
+
+        Returns:
+            LLMError subclass instance to raise in its place
+        """
+        # Several kinds can appear in one message; rate limits take priority
+        kinds = {match.lastgroup for match in _ERR_RE.finditer(str(err))}
+
+        if 'rate' in kinds:
+            self._handle_rate_limit_error(err)
+            return LLMRateLimitError(f"API rate limit exceeded: {err}")
+
+        elif 'timeout' in kinds:
+            return LLMTimeoutError(f"LLM request timeout: {err}")
 
-    def _update_request_tracking(self) -> None:
+        elif 'auth' in kinds:
+            return LLMConnectionError(f"LLM authentication error: {err}")
+
+        elif 'unavailable' in kinds:
+            return LLMUnavailableError(f"LLM service unavailable: {err}")
+
+        else:
+            error_msg = f"LLM response generation failed: {err}"
+            logger.error(error_msg)
+            return LLMError(error_msg)
+
+    def _is_response_cache_enabled(self) -> bool:
+        """Responses are only reusable when generation is deterministic."""
+        return self._response_cache_size > 0 and self.config.LLM_TEMPERATURE == 0
+
+    def _response_cache_key(self, prompt: str, system_prompt: Optional[str],
+                            max_tokens: Optional[int]) -> str:
+        """Build the response cache key from everything that affects the output."""
+        payload = json.dumps({
+            'model': self.config.GEMINI_MODEL_NAME,
+            'temperature': self.config.LLM_TEMPERATURE,
+            'system_prompt': system_prompt,
+            'prompt': prompt,
+            'max_tokens': max_tokens,
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _get_cached_response(self, key: str) -> Optional[str]:
+        """Look up a cached response, dropping it if it has expired."""
+        with self._response_cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is not None and time.time() - entry[1] < self._response_cache_ttl:
+                self._response_cache.move_to_end(key)
+                self._cache_hits += 1
+                return entry[0]
+
+            if entry is not None:
+                del self._response_cache[key]
+            self._cache_misses += 1
+            return None
+
+    def _store_cached_response(self, key: str, response_text: str) -> None:
+        """Store a response, evicting the least recently used entries when full."""
+        with self._response_cache_lock:
+            self._response_cache[key] = (response_text, time.time())
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > self._response_cache_size:
+                self._response_cache.popitem(last=False)
+
+    def _is_semantic_cache_enabled(self) -> bool:
+        """Paraphrased prompts are only answered from cache when generation is deterministic."""
+        return self._semantic_cache is not None and self.config.LLM_TEMPERATURE == 0
+
+    def _lookup_semantic_cache(self, prompt: str, system_prompt: Optional[str],
+                               max_tokens: Optional[int]) -> Optional[str]:
+        """Return the response to a similar earlier prompt made with the same settings."""
+        if not self._is_semantic_cache_enabled():
+            return None
+
+        response_text = self._semantic_cache.lookup(prompt, scope=(system_prompt, max_tokens))
+        if response_text is None:
+            return None
+
+        with self._response_cache_lock:
+            self._semantic_cache_hits += 1
+        logger.debug("Returning semantically cached LLM response")
+        return response_text
+
+    def clear_response_cache(self) -> None:
+        """Drop all cached LLM responses."""
+        with self._response_cache_lock:
+            self._response_cache.clear()
+        if self._semantic_cache is not None:
+            self._semantic_cache.clear()
+        logger.debug("LLM response cache cleared")
+
+    def _update_request_tracking(self, count: int = 1) -> None:
         """Update request tracking for rate limiting awareness."""
-        current_time = datetime.now()
+        current_time = time.time()
         self._last_request_time = current_time
-        self._request_count += 1
+        self._request_count += count
 
         # Reset counter every hour
         if (self._rate_limit_reset is None or
-                current_time > self._rate_limit_reset + timedelta(hours=1)):
-            self._request_count = 1
+                current_time > self._rate_limit_reset + _RATE_LIMIT_WINDOW):
+            self._request_count = count
             self._rate_limit_reset = current_time
 
     def _handle_rate_limit_error(self, error: Exception) -> None:
         """Handle rate limit errors and update tracking."""
         logger.warning(f"Rate limit encountered: {error}")
-        self._rate_limit_reset = datetime.now() + timedelta(hours=1)
+        self._rate_limit_reset = time.time() + _RATE_LIMIT_WINDOW
+        if self._token_bucket is not None:
+            self._token_bucket.penalize()
+
+    def _throttle(self, tokens: int = 1) -> None:
+        """
+        Wait for client-side rate limit tokens before calling the API.
+
+        Raises:
+            LLMRateLimitError: If the tokens are not available within LLM_TIMEOUT
+        """
+        if self._token_bucket is not None and not self._token_bucket.acquire(self.config.LLM_TIMEOUT, tokens):
+            raise LLMRateLimitError(f"Client-side rate limit of {self.config.LLM_RPM} requests/minute reached")
+
+    async def _athrottle(self, tokens: int = 1) -> None:
+        """
+        Async variant of _throttle() that does not block the event loop.
+
+        Raises:
+            LLMRateLimitError: If the tokens are not available within LLM_TIMEOUT
+        """
+        if self._token_bucket is not None and not await self._token_bucket.aacquire(self.config.LLM_TIMEOUT, tokens):
+            raise LLMRateLimitError(f"Client-side rate limit of {self.config.LLM_RPM} requests/minute reached")
 
     def get_health_status(self) -> Dict[str, Any]:
         """
         Get comprehensive LLM health status.
 
+        This only reads state kept fresh by the background health monitor
+        thread, so it never waits on the API.
+
         Returns:
             Dictionary with health status information
         """
@@ -323,57 +1046,56 @@ class LLMService:
             'max_retries': self.config.LLM_MAX_RETRIES,
             'timeout': self.config.LLM_TIMEOUT,
             'llm_status': 'not_initialized' if not self.llm else 'initialized',
+            'verified': self._verified,
             'request_tracking': {
                 'total_requests': self._request_count,
-                'last_request': self._last_request_time.isoformat() if self._last_request_time else None,
-                'rate_limit_reset': self._rate_limit_reset.isoformat() if self._rate_limit_reset else None
+                'last_request': _to_iso(self._last_request_time),
+                'rate_limit_reset': _to_iso(self._rate_limit_reset)
             }
         }
 
-        try:
-            # Perform connection test if it's been a while
-            current_time = time.time()
-            if (not self._last_health_check or
-                    current_time - self._last_health_check > self._health_check_interval):
-                status['connected'] = self.test_connection()
-            else:
-                status['connected'] = True  # Assume healthy if recently checked
-
-        except Exception as err:
-            log_exception(logger, err, "LLM health status check")
-            status['error'] = str(err)
+        # The health monitor thread keeps this fresh; never probe inline
+        status['connected'] = bool(self.llm) and self._healthy
 
         return status
 
-    def get_model_info(self) -> Dict[str, Any]:
+    def get_model_info(self) -> Mapping[str, Any]:
         """
         Get information about the current model.
 
+        The result is built once per service and returned as a read-only
+        mapping; copy it with dict(...) (and the nested 'configuration'
+        mapping) before modifying or serializing it.
+
         Returns:
-            Dictionary with model information
+            Read-only mapping with model information
         """
-        return {
+        return self._model_info
+
+    def _build_model_info(self) -> Mapping[str, Any]:
+        """Build the static model information returned by get_model_info()."""
+        return MappingProxyType({
             'model_name': self.config.GEMINI_MODEL_NAME,
             'provider': 'Google',
             'model_family': 'Gemini',
-            'configuration': {
+            'configuration': MappingProxyType({
                 'temperature': self.config.LLM_TEMPERATURE,
                 'max_retries': self.config.LLM_MAX_RETRIES,
                 'timeout': self.config.LLM_TIMEOUT
-            },
-            'capabilities': [
+            }),
+            'capabilities': (
                 'text_generation',
                 'conversation',
                 'code_generation',
                 'sql_generation',
                 'reasoning'
-            ],
-            'limitations': [
+            ),
+            'limitations': (
                 'no_direct_system_messages',
                 'rate_limited',
                 'context_window_limits'
-            ]
-        }
+            )
+        })
 
     def validate_prompt_for_sql(self, prompt: str) -> Dict[str, Any]:
         """
@@ -392,36 +1114,23 @@ class LLMService:
             'complexity_score': 0
         }
 
-        prompt_lower = prompt.lower().strip()
-
         # Check for empty or very short prompts
         if len(prompt.strip()) < 3:
             custom_validation['is_valid'] = False
             custom_validation['warnings'].append("Prompt is too short")
             return custom_validation
 
-        # Check for SQL injection patterns (basic check)
-        sql_injection_patterns = [
-            'drop table', 'delete from', 'update set', 'insert into',
-            'alter table', 'create table', 'truncate', '--', ';'
-        ]
+        injection_patterns, indicators = self._scan_prompt(prompt)
 
-        for pattern in sql_injection_patterns:
-            if pattern in prompt_lower:
-                custom_validation['warnings'].append(f"Potential SQL injection pattern detected: {pattern}")
+        # Check for SQL injection patterns (basic check), one warning per pattern
+        for pattern in injection_patterns:
+            custom_validation['warnings'].append(f"Potential SQL injection pattern detected: {pattern}")
 
-        # Check complexity indicators
-        complexity_indicators = [
-            'join', 'group by', 'order by', 'having', 'subquery',
-            'aggregate', 'sum', 'count', 'average', 'max', 'min'
-        ]
-
-        for indicator in complexity_indicators:
-            if indicator in prompt_lower:
-                custom_validation['complexity_score'] += 1
+        # Check complexity indicators; each distinct indicator counts once
+        custom_validation['complexity_score'] = len(indicators)
 
         # Provide suggestions based on prompt content
-        if 'show' in prompt_lower or 'list' in prompt_lower:
+        if _LISTING_RE.search(prompt):
             custom_validation['suggestions'].append("Consider specifying which columns you need")
 
         if custom_validation['complexity_score'] > 3:
@@ -429,6 +1138,40 @@ class LLMService:
 
         return custom_validation
 
+    @staticmethod
+    def _scan_prompt(prompt: str) -> Tuple[List[str], set]:
+        """
+        Find SQL injection patterns and complexity indicators in a prompt.
+
+        Uses one Aho-Corasick pass when pyahocorasick is installed, otherwise
+        the precompiled regexes.
+
+        Returns:
+            Tuple of (injection patterns in order of first appearance,
+            set of distinct complexity indicators)
+        """
+        if _PROMPT_AUTOMATON is None:
+            injection_patterns = dict.fromkeys(match.group(0).lower() for match in _SQL_INJECTION_RE.finditer(prompt))
+            indicators = {match.group(1).lower() for match in _COMPLEXITY_RE.finditer(prompt)}
+            return list(injection_patterns), indicators
+
+        # The automaton is case-sensitive with lowercase tokens; only copy when needed
+        prompt_lower = prompt if prompt.islower() else prompt.lower()
+        injection_patterns = {}
+        indicators = set()
+        for end, (kind, token) in _PROMPT_AUTOMATON.iter(prompt_lower):
+            if kind == 'injection':
+                injection_patterns[token] = None
+                continue
+
+            # Complexity indicators only count as whole words
+            start = end - len(token) + 1
+            if ((start == 0 or not _is_word_char(prompt_lower[start - 1])) and
+                    (end + 1 == len(prompt_lower) or not _is_word_char(prompt_lower[end + 1]))):
+                indicators.add(token)
+
+        return list(injection_patterns), indicators
+
     def get_usage_statistics(self) -> Dict[str, Any]:
         """
         Get LLM usage statistics.
@@ -436,24 +1179,50 @@ class LLMService:
         Returns:
             Dictionary with usage statistics
         """
+        with self._response_cache_lock:
+            cache_hits, cache_misses = self._cache_hits, self._cache_misses
+            cached_responses = len(self._response_cache)
+            semantic_cache_hits = self._semantic_cache_hits
+
         return {
             'total_requests': self._request_count,
-            'last_request_time': self._last_request_time.isoformat() if self._last_request_time else None,
+            'last_request_time': _to_iso(self._last_request_time),
             'rate_limit_status': {
-                'reset_time': self._rate_limit_reset.isoformat() if self._rate_limit_reset else None,
+                'reset_time': _to_iso(self._rate_limit_reset),
                 'requests_this_period': self._request_count
             },
+            'cache_hits': cache_hits,
+            'cache_misses': cache_misses,
+            'cached_responses': cached_responses,
+            'semantic_cache_hits': semantic_cache_hits,
             'health_status': self.get_health_status()
         }
 
     def close(self) -> None:
         """Clean up LLM service resources."""
         logger.info("Closing LLM service")
+        with _SERVICE_CACHE_LOCK:
+            for key, service in list(_SERVICE_CACHE.items()):
+                if service is self:
+                    del _SERVICE_CACHE[key]
+        self._stop_event.set()
+        self._healthy = False
         if self.llm:
-            # No specific cleanup needed for ChatGoogleGenerativeAI
+            self._close_client()
             self.llm = None
+        self.clear_response_cache()
         logger.info("LLM service closed successfully")
 
+    def _close_client(self) -> None:
+        """Close the persistent transport held by the LLM's API client."""
+        client = getattr(self.llm, 'client', None)
+        transport = getattr(client, 'transport', None)
+        try:
+            if transport is not None:
+                transport.close()
+        except Exception as err:
+            logger.warning(f"Failed to close LLM client transport: {err}")
+
     def __enter__(self):
         """Context manager entry."""
         return self
@@ -465,16 +1234,29 @@ class LLMService:
     def __repr__(self) -> str:
         """String representation of LLM service."""
         model = self.config.GEMINI_MODEL_NAME
-        connected = self.test_connection() if self.llm else False
+        # Never call the API here; the health monitor keeps _healthy current
+        connected = bool(self.llm) and self._healthy
         return f"LLMService(model={model}, connected={connected})"
 
 
-def create_llm_service(custom_config: Optional[Config] = None) -> LLMService:
+# Shared services keyed by (id(config), model name); see create_llm_service()
+_SERVICE_CACHE: Dict[Tuple[int, str], "LLMService"] = {}
+_SERVICE_CACHE_LOCK = threading.Lock()
+
+
+def create_llm_service(custom_config: Optional[Config] = None, verify_on_init: bool = False) -> LLMService:
     """
-    Factory function to create an LLM service instance.
+    Factory function returning the shared LLM service for a configuration.
+
+    Services are memoized per configuration object and model name, so
+    repeated calls reuse one LLM client, its caches and its health monitor.
+    Closing a service removes it from the cache; the next call creates a
+    fresh one.
 
     Args:
         custom_config: Optional configuration instance
+        verify_on_init: If True, make a test request when the service is
+            created (or, for a cached service, if it has not been verified yet)
 
     Returns:
         Configured LLMService instance
@@ -483,7 +1265,17 @@ def create_llm_service(custom_config: Optional[Config] = None) -> LLMService:
         from backend.app.config import get_config
         custom_config = get_config()
 
-    return LLMService(custom_config)
+    key = (id(custom_config), custom_config.GEMINI_MODEL_NAME)
+    with _SERVICE_CACHE_LOCK:
+        service = _SERVICE_CACHE.get(key)
+        if service is None:
+            service = LLMService(custom_config, verify_on_init=verify_on_init)
+            _SERVICE_CACHE[key] = service
+            return service
+
+    if verify_on_init and not service._verified:
+        service._verify_connection()
+    return service
 
 
 if __name__ == "__main__":
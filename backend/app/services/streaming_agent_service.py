@@ -5,89 +5,317 @@ This enhanced version provides real-time streaming of the agent's thought proces
 using custom callback handlers and server-sent events.
 """
 
+import hashlib
+import itertools
 import json
+import os
+import re
 import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime
-from queue import Queue, Empty
-from typing import Dict, Any, Optional, Generator
+from typing import Dict, Any, Iterator, List, Optional, Generator, Tuple
+from uuid import UUID
+
+try:
+    import orjson
+except ImportError:  # optional, json is the fallback
+    orjson = None
 
 from langchain.agents import AgentExecutor
 from langchain.callbacks.base import BaseCallbackHandler
 from langchain.schema import AgentAction, AgentFinish
+from langchain_core.exceptions import OutputParserException
+from langchain_core.tools import BaseTool
 from langchain_community.agent_toolkits import create_sql_agent, SQLDatabaseToolkit
 from langchain_community.utilities import SQLDatabase
 
 from backend.app.config import Config
 from backend.app.services.database_service import DatabaseService
 from backend.app.services.llm_service import LLMService
+from backend.app.utils.action_cache import ActionCache, ACTION_CACHE_HIT_EVENT, cache_tool_actions
 from backend.app.utils.logger import get_logger
+from backend.app.utils.semantic_cache import SemanticCache
 from backend.app.utils.react_loop_utils import (
     extract_thought_from_log,
-    categorize_tool_action,
+    get_tool_info,
     format_sql_query,
     detect_result_type
 )
 
 logger = get_logger(__name__)
 
+# Event types that end the stream of agent events
+_TERMINAL_EVENT_TYPES = frozenset({"agent_finish", "agent_error"})
+
+# Events already waiting when the consumer wakes are sent together in one
+# "batch" message, up to this many per message to bound the delay
+_MAX_BATCH_EVENTS = 32
+
+# Opening agent turn (replaces LangChain's SQL_FUNCTIONS_SUFFIX). Asking for all
+# relevant schemas at once turns k sequential schema lookups into one tool call,
+# or into parallel tool calls issued in a single agent turn.
+_AGENT_SUFFIX = (
+    "I should look at the tables in the database to see what I can query. "
+    "Then I should fetch the schemas of all the relevant tables at once, passing them "
+    "to a single schema lookup as a comma-separated list or as parallel tool calls."
+)
+
+# Indexes into StreamingAgentService._counters
+_TOTAL, _SUCCESSFUL, _FAILED, _ANSWER_CACHE_HITS = range(4)
+
+# Sequence numbers for query ids, unique within this process
+_QUERY_IDS = itertools.count(1)
+
+
+def _new_query_id() -> str:
+    """
+    Create an id for one streamed agent run.
+
+    Combines the process id with a per-process counter, so concurrent requests
+    in the same second or in different server workers never share an id. The
+    pid is read on every call because forked workers inherit the counter.
+    """
+    return f"query_{os.getpid()}_{next(_QUERY_IDS)}"
+
+
+# Pseudo-tool AgentExecutor reports when the LLM output could not be parsed
+_PARSE_ERROR_TOOL = "_Exception"
+
+# Patterns used to recover the intended step from unparseable LLM output
+_CODE_FENCE_RE = re.compile(r"```[a-zA-Z]*")
+_ACTION_BLOCK_RE = re.compile(r"Action\s*:\s*(?P<tool>[^\n]+)\s*Action\s*Input\s*:\s*(?P<input>.+)", re.DOTALL)
+
+
+def _repair_parsing_error(error: OutputParserException) -> str:
+    """
+    Turn an output parsing error into a targeted hint for the agent's retry.
+
+    AgentExecutor feeds the returned text back to the LLM as the observation.
+    Instead of a generic "invalid format" message, recover what the model
+    meant (an Action/Action Input block or a JSON object, with code fences
+    removed) and echo it back, so the next attempt usually parses.
+
+    Args:
+        error: Parsing error raised by the agent's output parser
+
+    Returns:
+        Observation text for the next agent step
+    """
+    text = _CODE_FENCE_RE.sub("", str(error.llm_output or "")).strip()
+
+    match = _ACTION_BLOCK_RE.search(text)
+    if match:
+        return (f"Your last response could not be parsed. It looks like a call to "
+                f"'{match.group('tool').strip()}' with input '{match.group('input').strip()}'. "
+                f"Repeat that call using the required tool calling format.")
+
+    start = text.find("{")
+    if start != -1:
+        try:
+            payload, _ = json.JSONDecoder().raw_decode(text, start)
+            return (f"Your last response could not be parsed. Resend this tool call "
+                    f"using the required tool calling format: {json.dumps(payload)}")
+        except ValueError:
+            pass
+
+    if error.send_to_llm and error.observation:
+        return str(error.observation)
+    return "Invalid or incomplete response. Reply with a valid tool call or a final answer."
+
+
+# Process-wide workers for sync agent runs, created on first use
+_AGENT_POOL: Optional[ThreadPoolExecutor] = None
+_AGENT_POOL_LOCK = threading.Lock()
+
+
+def _get_agent_pool(max_workers: int) -> ThreadPoolExecutor:
+    """
+    Get the shared thread pool that runs agents for streaming requests.
+
+    A bounded pool avoids creating a thread per request and caps concurrent
+    agent runs, which also limits the load put on the LLM provider.
+
+    Args:
+        max_workers: Pool size used when the pool is first created
+
+    Returns:
+        The shared ThreadPoolExecutor
+    """
+    global _AGENT_POOL
+    if _AGENT_POOL is None:
+        with _AGENT_POOL_LOCK:
+            if _AGENT_POOL is None:
+                _AGENT_POOL = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="agent")
+    return _AGENT_POOL
+
+
+# (epoch second, ISO string for that second); swapped as one tuple so readers
+# on other threads never see a mismatched pair
+_ts_cache = (0, "")
+
+
+def _now_iso() -> str:
+    """
+    Current local time as an ISO 8601 string with millisecond precision.
+
+    The date and time part is formatted once per second and reused, so
+    callbacks on the hot path only format the milliseconds.
+    """
+    global _ts_cache
+    now = time.time()
+    second = int(now)
+    cached = _ts_cache
+    if cached[0] != second:
+        cached = _ts_cache = (second, datetime.fromtimestamp(second).isoformat())
+    return f"{cached[1]}.{int((now - second) * 1000):03d}"
+
+
+def _dumps(event: Dict[str, Any]) -> bytes:
+    """Serialize an event to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(event, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(event).encode()
+
+
+def _sse_message(event: Dict[str, Any]) -> bytes:
+    """Format an event as a server-sent event message."""
+    return b"data: " + _dumps(event) + b"\n\n"
+
+
+def _sse_batch(events: List[Dict[str, Any]]) -> bytes:
+    """Format events as one server-sent event message, wrapping several in a batch."""
+    if len(events) == 1:
+        return _sse_message(events[0])
+    return _sse_message({"type": "batch", "events": events})
+
+
+# Messages that never change are framed once. Clients only use heartbeats to keep
+# the connection alive, so they carry no timestamp and can be reused verbatim.
+_HEARTBEAT_SSE = _sse_message({"type": "heartbeat"})
+_EMPTY_QUESTION_SSE = _sse_message({'type': 'error', 'message': 'Question cannot be empty'})
+_AGENT_NOT_INITIALIZED_SSE = _sse_message({'type': 'error', 'message': 'Agent not initialized'})
+
 
 class StreamingCallbackHandler(BaseCallbackHandler):
     """
     Custom callback handler that captures agent execution steps in real-time
-    and streams them via a queue.
+    and hands them to the streaming consumer.
+
+    Events are appended to a deque (append/popleft are atomic) and a single
+    threading.Event wakes the consumer, which avoids the lock and condition
+    round-trip a queue.Queue pays on every put and get.
     """
 
-    def __init__(self, event_queue: Queue):
+    def __init__(self, query_id: Optional[str] = None):
         super().__init__()
-        self.event_queue = event_queue
+        self.query_id = query_id
         self.step_counter = 0
         self.current_thought = None
+        self.events: deque = deque()
+        self.new_event = threading.Event()
+        self.closed = False
+
+    def put(self, event: Dict[str, Any]) -> None:
+        """Publish an event to the consumer."""
+        self.events.append(event)
+        self.new_event.set()
+
+    def close(self) -> None:
+        """Signal that no further events will be published."""
+        self.closed = True
+        self.new_event.set()
+
+    def build_error_event(self, error: BaseException) -> Dict[str, Any]:
+        """Build the event for an execution error."""
+        return {
+            "type": "agent_error",
+            "query_id": self.query_id,
+            "timestamp": _now_iso(),
+            "error": {
+                "message": str(error),
+                "type": type(error).__name__
+            }
+        }
 
     def on_agent_action(self, action: AgentAction, **kwargs: Any) -> None:
         """Called when the agent takes an action."""
+        self.put(self._build_action_event(action))
+
+    def on_tool_end(self, output: str, **kwargs: Any) -> None:
+        """Called when a tool finishes execution."""
+        event = self._build_observation_event(output, kwargs.get('name', 'unknown'))
+        if event is not None:
+            self.put(event)
+
+    def on_agent_finish(self, finish: AgentFinish, **kwargs: Any) -> None:
+        """Called when the agent finishes execution."""
+        self.put(self._build_finish_event(finish))
+
+    def on_chain_error(self, error: BaseException, **kwargs: Any) -> None:
+        """Called when an error occurs."""
+        self.put(self.build_error_event(error))
+
+    def on_custom_event(self, name: str, data: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        """Called for custom events, such as action cache hits."""
+        if name == ACTION_CACHE_HIT_EVENT:
+            self.put(self._build_cache_hit_event(data))
+
+    def _build_action_event(self, action: AgentAction) -> Dict[str, Any]:
+        """Build the event for an agent action and advance the step counter."""
+        if action.tool == _PARSE_ERROR_TOOL:
+            return self._build_parse_repair_event(action)
+
         self.step_counter += 1
 
         # Extract thought from the action log
         thought = extract_thought_from_log(action.log)
 
         # Get tool information
-        tool_info = categorize_tool_action(action.tool)
+        tool_info = get_tool_info(action.tool)
 
         # Format tool input
         formatted_input = action.tool_input
         if action.tool == 'sql_db_query' and isinstance(action.tool_input, str):
             formatted_input = format_sql_query(action.tool_input)
 
-        # Create action event
-        action_event = {
+        return {
             "type": "agent_action",
+            "query_id": self.query_id,
             "step_number": self.step_counter,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "thought": thought,
             "action": {
                 "tool": action.tool,
-                "category": tool_info['category'],
-                "description": tool_info['description'],
-                "purpose": tool_info['purpose'],
+                "category": tool_info.category,
+                "description": tool_info.description,
+                "purpose": tool_info.purpose,
                 "input": formatted_input,
                 "raw_input": action.tool_input
             }
         }
 
-        # Stream the action
-        self.event_queue.put(action_event)
+    def _build_parse_repair_event(self, action: AgentAction) -> Dict[str, Any]:
+        """Build the event for an unparseable LLM response being sent back for a retry."""
+        return {
+            "type": "parse_repair",
+            "query_id": self.query_id,
+            "step_number": self.step_counter,
+            "timestamp": _now_iso(),
+            "message": action.tool_input
+        }
 
-    def on_tool_end(self, output: str, **kwargs: Any) -> None:
-        """Called when a tool finishes execution."""
-        # Get the tool name from kwargs if available
-        tool_name = kwargs.get('name', 'unknown')
+    def _build_observation_event(self, output: str, tool_name: str) -> Optional[Dict[str, Any]]:
+        """Build the event for a tool observation (None for the parse error pseudo-tool)."""
+        if tool_name == _PARSE_ERROR_TOOL:
+            return None
 
-        # Create observation event
-        observation_event = {
+        return {
             "type": "agent_observation",
+            "query_id": self.query_id,
             "step_number": self.step_counter,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "observation": {
                 "result": output,
                 "result_type": detect_result_type(output, tool_name),
@@ -95,33 +323,37 @@ class StreamingCallbackHandler(BaseCallbackHandler):
             }
         }
 
-        # Stream the observation
-        self.event_queue.put(observation_event)
-
-    def on_agent_finish(self, finish: AgentFinish, **kwargs: Any) -> None:
-        """Called when the agent finishes execution."""
-        finish_event = {
+    def _build_finish_event(self, finish: AgentFinish) -> Dict[str, Any]:
+        """Build the event for the agent's final answer."""
+        return {
             "type": "agent_finish",
-            "timestamp": datetime.now().isoformat(),
+            "query_id": self.query_id,
+            "timestamp": _now_iso(),
             "final_answer": finish.return_values.get("output", "No answer generated"),
             "total_steps": self.step_counter
         }
 
-        # Stream the final answer
-        self.event_queue.put(finish_event)
-
-    def on_chain_error(self, error: Exception, **kwargs: Any) -> None:
-        """Called when an error occurs."""
-        error_event = {
-            "type": "agent_error",
-            "timestamp": datetime.now().isoformat(),
-            "error": {
-                "message": str(error),
-                "type": type(error).__name__
-            }
+    def _build_cache_hit_event(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the event for a tool call served from the action cache."""
+        return {
+            "type": "cache_hit",
+            "query_id": self.query_id,
+            "step_number": self.step_counter,
+            "timestamp": _now_iso(),
+            "tool": data.get("tool")
         }
 
-        self.event_queue.put(error_event)
+
+class CachedSQLDatabaseToolkit(SQLDatabaseToolkit):
+    """
+    SQL toolkit whose read-only tools answer repeated calls from an ActionCache.
+    """
+
+    action_cache: ActionCache
+
+    def get_tools(self) -> List[BaseTool]:
+        """Get the toolkit tools with cacheable tools wrapped in cache proxies."""
+        return cache_tool_actions(super().get_tools(), self.action_cache)
 
 
 class StreamingAgentService:
@@ -139,31 +371,77 @@ class StreamingAgentService:
         self.agent_executor: Optional[AgentExecutor] = None
         self.sql_database: Optional[SQLDatabase] = None
         self.toolkit: Optional[SQLDatabaseToolkit] = None
+        self._agent_lock = threading.Lock()
+        self._agent_init_error: Optional[str] = None
+        self._usable_tables: Optional[Tuple[str, ...]] = None
+
+        # Outputs of repeated read-only tool calls, shared across requests
+        self.action_cache: Optional[ActionCache] = None
+        if self.config.ACTION_CACHE_TTL > 0:
+            self.action_cache = ActionCache(
+                max_entries=self.config.ACTION_CACHE_SIZE,
+                ttl=self.config.ACTION_CACHE_TTL,
+                query_ttl=self.config.ACTION_CACHE_QUERY_TTL
+            )
+
+        # Completed runs replayed for paraphrased questions, invalidated by schema changes
+        self._answer_cache: Optional[SemanticCache] = None
+        if self.config.AGENT_ANSWER_CACHE_ENABLED:
+            self._answer_cache = SemanticCache(
+                threshold=self.config.AGENT_ANSWER_CACHE_THRESHOLD,
+                max_entries=self.config.SEMANTIC_CACHE_MAX_ENTRIES,
+                ttl=self.config.AGENT_ANSWER_CACHE_TTL,
+                model_name=self.config.SEMANTIC_CACHE_MODEL
+            )
 
         # Statistics
-        self._total_queries = 0
-        self._successful_queries = 0
-        self._failed_queries = 0
+        # Query counters (total, successful, failed, answer cache hits), updated
+        # from request and agent worker threads and read as one consistent snapshot
+        self._counters = [0, 0, 0, 0]
+        self._counters_lock = threading.Lock()
 
         logger.info("Initializing StreamingAgentService")
         self._validate_dependencies()
-        self._initialize_agent()
-        logger.info("StreamingAgentService initialized successfully")
+        logger.info("StreamingAgentService initialized successfully, SQL agent is built on first use")
 
     def _validate_dependencies(self) -> None:
         """Validate that required services are properly initialized."""
+        # The LLM connection is verified by the first request and the background
+        # health monitor rather than a live probe at startup
         if not self.llm_service or not self.llm_service.llm:
             raise Exception("LLM service is not properly initialized")
 
-        if not self.llm_service.test_connection():
-            raise Exception("LLM service connection test failed")
-
         if not self.database_service or not self.database_service.engine:
             raise Exception("Database service is not properly initialized")
 
         if not self.database_service.test_connection():
             raise Exception("Database service connection test failed")
 
+    def _ensure_agent(self) -> bool:
+        """
+        Build the SQL agent on first use.
+
+        Creating the LangChain SQLDatabase reflects every table, so it is
+        deferred until the first question instead of slowing down startup in
+        every worker.
+
+        Returns:
+            True if the agent is ready, False if it could not be built
+        """
+        if self.agent_executor is not None:
+            return True
+
+        with self._agent_lock:
+            if self.agent_executor is None:
+                try:
+                    self._initialize_agent()
+                    self._agent_init_error = None
+                except Exception as err:
+                    self._agent_init_error = str(err)
+                    return False
+
+        return True
+
     def _initialize_agent(self) -> None:
         """Initialize the LangChain SQL agent."""
         try:
@@ -171,26 +449,34 @@ class StreamingAgentService:
             self.sql_database = SQLDatabase.from_uri(
                 database_uri=self.config.DATABASE_URI,
                 include_tables=None,
-                sample_rows_in_table_info=3
+                sample_rows_in_table_info=self.config.AGENT_SAMPLE_ROWS
             )
+            self._usable_tables = tuple(self.sql_database.get_usable_table_names())
 
             # Create SQL toolkit
-            self.toolkit = SQLDatabaseToolkit(
-                db=self.sql_database,
-                llm=self.llm_service.llm
-            )
+            if self.action_cache is not None:
+                self.toolkit = CachedSQLDatabaseToolkit(
+                    db=self.sql_database,
+                    llm=self.llm_service.llm,
+                    action_cache=self.action_cache
+                )
+            else:
+                self.toolkit = SQLDatabaseToolkit(
+                    db=self.sql_database,
+                    llm=self.llm_service.llm
+                )
 
             # Create agent executor
             self.agent_executor = create_sql_agent(
                 llm=self.llm_service.llm,
                 toolkit=self.toolkit,
+                suffix=_AGENT_SUFFIX,
                 verbose=self.config.AGENT_VERBOSE,
                 agent_type=self.config.AGENT_TYPE,
                 max_iterations=self.config.AGENT_MAX_ITERATIONS,
                 max_execution_time=self.config.AGENT_MAX_EXECUTION_TIME,
                 early_stopping_method="generate",
-                handle_parsing_errors=True,
-                return_intermediate_steps=False  # We handle this with callbacks
+                agent_executor_kwargs={"handle_parsing_errors": _repair_parsing_error}
             )
 
             logger.info("Streaming SQL agent created successfully")
@@ -199,7 +485,7 @@ class StreamingAgentService:
             logger.error(f"Failed to initialize streaming SQL agent: {err}")
             raise
 
-    def stream_agent_execution(self, question: str) -> Generator[str, None, None]:
+    def stream_agent_execution(self, question: str) -> Generator[bytes, None, None]:
         """
         Stream the agent execution in real-time.
 
@@ -207,81 +493,106 @@ class StreamingAgentService:
             question: Natural language question
 
         Yields:
-            Server-sent event formatted strings
+            Server-sent event messages as UTF-8 bytes
         """
         if not question or not question.strip():
-            yield f"data: {json.dumps({'type': 'error', 'message': 'Question cannot be empty'})}\n\n"
+            yield _EMPTY_QUESTION_SSE
             return
 
-        if not self.agent_executor:
-            yield f"data: {json.dumps({'type': 'error', 'message': 'Agent not initialized'})}\n\n"
+        if not self._ensure_agent():
+            yield _AGENT_NOT_INITIALIZED_SSE
             return
 
-        # Create event queue for streaming
-        event_queue = Queue()
-
-        # Create streaming callback handler
-        streaming_handler = StreamingCallbackHandler(event_queue)
+        cached_events, schema_fingerprint = self._lookup_cached_answer(question)
 
-        # Start execution in separate thread
-        execution_thread = threading.Thread(
-            target=self._execute_agent_with_callbacks,
-            args=(question, streaming_handler, event_queue)
-        )
+        query_id = _new_query_id()
 
         # Send initial event
         start_event = {
             "type": "execution_start",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "question": question,
-            "query_id": f"query_{int(time.time())}"
+            "query_id": query_id
         }
-        yield f"data: {json.dumps(start_event)}\n\n"
+        yield _sse_message(start_event)
 
-        # Start execution
-        execution_thread.start()
+        if cached_events is not None:
+            yield from self._replay_cached_answer(cached_events, query_id)
+            return
 
-        # Stream events as they come
+        # Create streaming callback handler
+        streaming_handler = StreamingCallbackHandler(query_id)
+        events = streaming_handler.events
+        new_event = streaming_handler.new_event
+        recorded: Optional[List[Dict[str, Any]]] = [] if schema_fingerprint is not None else None
+
+        # Start execution on the shared agent pool
+        execution_future = _get_agent_pool(self.config.AGENT_POOL_SIZE).submit(
+            self._execute_agent_with_callbacks, question, streaming_handler
+        )
+
+        # Stream events as they come. A heartbeat is only sent once nothing has
+        # been sent for heartbeat_interval seconds, so active runs send none.
+        heartbeat_interval = self.config.AGENT_HEARTBEAT_INTERVAL
+        next_heartbeat = time.monotonic() + heartbeat_interval
         execution_finished = False
         while not execution_finished:
-            try:
-                # Get event from queue (timeout to avoid blocking)
-                event = event_queue.get(timeout=1.0)
-
-                # Send event to client
-                yield f"data: {json.dumps(event)}\n\n"
-
-                # Check if execution is finished
-                if event.get("type") in ["agent_finish", "agent_error"]:
-                    execution_finished = True
-
-            except Empty:
+            new_event.wait(timeout=max(0.0, next_heartbeat - time.monotonic()))
+
+            # Clear before draining so an event published mid-drain re-arms the flag
+            new_event.clear()
+            while events and not execution_finished:
+                # Coalesce everything that is already waiting into one message
+                batch = []
+                while events and len(batch) < _MAX_BATCH_EVENTS:
+                    event = events.popleft()
+                    batch.append(event)
+
+                    # Check if execution is finished
+                    if event.get("type") in _TERMINAL_EVENT_TYPES:
+                        execution_finished = True
+                        break
+
+                # Send events to client
+                yield _sse_batch(batch)
+                next_heartbeat = time.monotonic() + heartbeat_interval
+                if recorded is not None:
+                    recorded.extend(batch)
+
+            if execution_finished or (streaming_handler.closed and not events):
+                break
+
+            now = time.monotonic()
+            if now >= next_heartbeat:
                 # Send heartbeat to keep connection alive
-                heartbeat = {
-                    "type": "heartbeat",
-                    "timestamp": datetime.now().isoformat()
-                }
-                yield f"data: {json.dumps(heartbeat)}\n\n"
-
-                # Check if thread is still alive
-                if not execution_thread.is_alive():
+                yield _HEARTBEAT_SSE
+                next_heartbeat = now + heartbeat_interval
+
+                # Check if execution is still running (or waiting for a worker)
+                if execution_future.done():
                     break
 
-        # Wait for thread to finish
-        execution_thread.join(timeout=5.0)
+        # Wait for execution to finish
+        try:
+            execution_future.result(timeout=5.0)
+        except FutureTimeoutError:
+            logger.warning("Agent execution still running after the stream ended")
+
+        if recorded is not None:
+            self._remember_answer(question, schema_fingerprint, recorded)
 
         # Send completion event
         completion_event = {
             "type": "execution_complete",
-            "timestamp": datetime.now().isoformat()
+            "query_id": query_id,
+            "timestamp": _now_iso()
         }
-        yield f"data: {json.dumps(completion_event)}\n\n"
+        yield _sse_message(completion_event)
 
-    def _execute_agent_with_callbacks(self, question: str, streaming_handler: StreamingCallbackHandler,
-                                      event_queue: Queue) -> None:
+    def _execute_agent_with_callbacks(self, question: str, streaming_handler: StreamingCallbackHandler) -> None:
         """Execute the agent with streaming callbacks."""
         try:
-            self._total_queries += 1
+            self._count_query(_TOTAL)
             start_time = time.time()
 
             # Execute agent with callback
@@ -296,47 +607,122 @@ class StreamingAgentService:
             # Send execution summary
             summary_event = {
                 "type": "execution_summary",
-                "timestamp": datetime.now().isoformat(),
+                "query_id": streaming_handler.query_id,
+                "timestamp": _now_iso(),
                 "execution_time": round(execution_time, 2),
                 "success": True
             }
-            event_queue.put(summary_event)
+            streaming_handler.put(summary_event)
 
-            self._successful_queries += 1
+            self._count_query(_SUCCESSFUL)
 
         except Exception as e:
             logger.error(f"Agent execution error: {e}")
+            streaming_handler.put(streaming_handler.build_error_event(e))
 
-            error_event = {
-                "type": "agent_error",
-                "timestamp": datetime.now().isoformat(),
-                "error": {
-                    "message": str(e),
-                    "type": type(e).__name__
-                }
-            }
-            event_queue.put(error_event)
+            self._count_query(_FAILED)
+
+        finally:
+            streaming_handler.close()
+
+    def _schema_fingerprint(self) -> Optional[str]:
+        """
+        Hash the table names and schemas the agent's answers depend on.
+
+        Uses the database service's cached introspection, so it is cheap while
+        the schema cache is fresh.
+
+        Returns:
+            Hex digest of the current schema, or None if it cannot be read
+        """
+        try:
+            schemas = self.database_service.get_all_schemas()
+        except Exception as err:
+            logger.warning(f"Unable to fingerprint database schema for the answer cache: {err}")
+            return None
+
+        payload = json.dumps(schemas, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _lookup_cached_answer(self, question: str) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+        """
+        Find a completed run for a semantically similar question.
+
+        Args:
+            question: Natural language question
+
+        Returns:
+            Tuple of (cached events or None, current schema fingerprint). The
+            fingerprint is None when the answer cache is disabled or unusable,
+            in which case the run should not be recorded.
+        """
+        if self._answer_cache is None or not self._answer_cache.is_available():
+            return None, None
+
+        fingerprint = self._schema_fingerprint()
+        if fingerprint is None:
+            return None, None
+
+        entry = self._answer_cache.lookup(question)
+        if entry is None or entry[0] != fingerprint:
+            # Entries recorded against an older schema are left to expire
+            return None, fingerprint
+
+        self._count_query(_ANSWER_CACHE_HITS)
+        logger.info("Replaying cached agent run for a similar question")
+        return entry[1], fingerprint
+
+    def _remember_answer(self, question: str, schema_fingerprint: str,
+                         events: List[Dict[str, Any]]) -> None:
+        """Store the events of a run that ended with a final answer."""
+        if not events or events[-1].get("type") != "agent_finish":
+            return
 
-            self._failed_queries += 1
+        try:
+            self._answer_cache.store(question, (schema_fingerprint, events))
+        except Exception as err:
+            logger.warning(f"Failed to cache agent run: {err}")
+
+    @staticmethod
+    def _replay_cached_answer(events: List[Dict[str, Any]], query_id: str) -> Iterator[bytes]:
+        """Yield a cached run's events under a new query id and fresh timestamps, then the completion event."""
+        for start in range(0, len(events), _MAX_BATCH_EVENTS):
+            batch = events[start:start + _MAX_BATCH_EVENTS]
+            yield _sse_batch([dict(event, query_id=query_id, timestamp=_now_iso()) for event in batch])
+
+        yield _sse_message({
+            "type": "execution_complete",
+            "query_id": query_id,
+            "timestamp": _now_iso(),
+            "cached": True
+        })
+
+    def _count_query(self, counter: int) -> None:
+        """Increment one of the query counters."""
+        with self._counters_lock:
+            self._counters[counter] += 1
 
     def get_usage_statistics(self) -> Dict[str, Any]:
         """Get usage statistics."""
-        success_rate = (
-            (self._successful_queries / self._total_queries * 100)
-            if self._total_queries > 0 else 0
-        )
+        with self._counters_lock:
+            total, successful, failed, answer_cache_hits = self._counters
+
+        success_rate = (successful / total * 100) if total > 0 else 0
 
         return {
-            "total_queries": self._total_queries,
-            "successful_queries": self._successful_queries,
-            "failed_queries": self._failed_queries,
+            "total_queries": total,
+            "successful_queries": successful,
+            "failed_queries": failed,
+            "answer_cache_hits": answer_cache_hits,
             "success_rate_percent": round(success_rate, 2)
         }
 
     def get_agent_status(self) -> Dict[str, Any]:
         """Get agent status information."""
         return {
-            "initialized": self.agent_executor is not None,
+            "initialized": self._agent_init_error is None,
+            "agent_built": self.agent_executor is not None,
+            "initialization_error": self._agent_init_error,
             "streaming_enabled": True,
             "llm_service_status": self.llm_service.get_health_status(),
             "database_service_status": self.database_service.get_health_status(),
@@ -347,7 +733,8 @@ class StreamingAgentService:
                 "verbose": self.config.AGENT_VERBOSE
             },
             "statistics": self.get_usage_statistics(),
-            "available_tables": list(self.sql_database.get_usable_table_names()) if self.sql_database else []
+            "action_cache": self.action_cache.get_statistics() if self.action_cache else None,
+            "available_tables": list(self._usable_tables or ())
         }
 
 
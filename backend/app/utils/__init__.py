@@ -7,9 +7,12 @@ other shared utilities.
 
 Available modules:
 - logger: Centralized logging system with file rotation and console output
+- semantic_cache: Embedding-similarity cache for paraphrased prompts
+- action_cache: TTL cache and tool proxies for repeated read-only agent tool calls
 """
 
 from .logger import get_logger, log_function_call, log_exception
+from .semantic_cache import SemanticCache
 
 # Package metadata
 __version__ = "1.0.0"
@@ -19,5 +22,6 @@ __author__ = "NL-to-SQL Agent Team"
 __all__ = [
     'get_logger',
     'log_function_call',
-    'log_exception'
+    'log_exception',
+    'SemanticCache'
 ]
\ No newline at end of file
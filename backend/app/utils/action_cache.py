@@ -0,0 +1,306 @@
+"""
+Action Cache for NL-to-SQL Agent
+
+This module caches the outputs of read-only agent tools so repeated tool calls
+(listing tables, fetching a table schema, re-running the same query) are
+answered without another database round-trip, both within one ReAct loop and
+across user turns.
+
+Entries are keyed by the tool name and its input, kept in least-recently-used
+order and expire after a configurable TTL so changes made outside the agent
+are eventually picked up. Query results get their own, shorter TTL. Only
+read-only SQL is cached: a SELECT/WITH statement that names no data-modifying
+keyword outside string literals and comments. Any other statement run by the
+agent clears the cache.
+
+Usage:
+    from app.utils.action_cache import ActionCache, cache_tool_actions
+
+    cache = ActionCache(max_entries=1024, ttl=300, query_ttl=30)
+    tools = cache_tool_actions(toolkit.get_tools(), cache)
+"""
+
+import hashlib
+import inspect
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from langchain_core.callbacks.manager import adispatch_custom_event, dispatch_custom_event
+from langchain_core.tools import BaseTool
+
+from .logger import get_logger
+
+# Initialize logger for this module
+logger = get_logger(__name__)
+
+# Name of the custom callback event dispatched when a tool call is served from the cache
+ACTION_CACHE_HIT_EVENT = 'action_cache_hit'
+
+# Tools whose output depends only on their input and the database contents
+CACHEABLE_TOOLS = frozenset({'sql_db_list_tables', 'sql_db_schema', 'sql_db_query'})
+
+# Tool that runs arbitrary SQL; its input is keyed verbatim since whitespace
+# inside string literals is significant
+SQL_QUERY_TOOL = 'sql_db_query'
+
+# Statements that may only read data: those starting with SELECT or WITH
+_READ_QUERY_START_RE = re.compile(r'\s*\(*\s*(?:SELECT|WITH)\b', re.IGNORECASE)
+
+# Literals, quoted identifiers and comments (skipped), or keywords that make a
+# SELECT/WITH statement write data (data-modifying CTEs, SELECT ... INTO)
+_SQL_WRITE_SCAN_RE = re.compile(
+    r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"]|\"\")*\"|`[^`]*`|--[^\n]*|/\*.*?\*/"
+    r"|(?P<write>\b(?:INSERT|UPDATE|DELETE|MERGE|INTO)\b)",
+    re.IGNORECASE | re.DOTALL
+)
+
+
+def _is_read_only_sql(statement: str) -> bool:
+    """
+    Check whether a SQL statement only reads data.
+
+    Args:
+        statement: SQL text as passed to the query tool
+
+    Returns:
+        True for SELECT/WITH statements without INSERT, UPDATE, DELETE, MERGE
+        or INTO outside string literals, quoted identifiers and comments
+    """
+    if _READ_QUERY_START_RE.match(statement) is None:
+        return False
+    return not any(match.lastgroup == 'write' for match in _SQL_WRITE_SCAN_RE.finditer(statement))
+
+
+class ActionCache:
+    """
+    Thread-safe LRU cache of tool outputs with per-entry expiry.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 300, query_ttl: float = 30):
+        """
+        Initialize the action cache.
+
+        Args:
+            max_entries: Maximum number of cached tool outputs
+            ttl: Lifetime of an entry in seconds
+            query_ttl: Lifetime of a SQL query result in seconds, capped at ttl
+                (0 disables caching query results)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.query_ttl = min(query_ttl, ttl)
+
+        # Key -> (output, expiry time)
+        self._entries: "OrderedDict[bytes, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def make_key(tool_name: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> bytes:
+        """
+        Build the cache key for a tool call.
+
+        Whitespace in the input is collapsed so formatting differences between
+        otherwise identical calls still hit, except for SQL queries, which are
+        keyed verbatim because string literals are whitespace- and
+        case-sensitive.
+
+        Args:
+            tool_name: Name of the tool
+            args: Positional tool input
+            kwargs: Keyword tool input
+
+        Returns:
+            16-byte digest identifying the call
+        """
+        if tool_name == SQL_QUERY_TOOL:
+            normalize = str
+        else:
+            def normalize(value: Any) -> str:
+                return ' '.join(str(value).split())
+
+        parts = [normalize(arg) for arg in args]
+        parts.extend(f"{key}={normalize(value)}" for key, value in sorted(kwargs.items()))
+        payload = f"{tool_name}|{'|'.join(parts)}"
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[Any]:
+        """
+        Look up a cached tool output, dropping it if it has expired.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            The cached output, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.time() < entry[1]:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+
+            if entry is not None:
+                del self._entries[key]
+            self._misses += 1
+            return None
+
+    def set(self, key: bytes, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a tool output, evicting the least recently used entries when full.
+
+        Args:
+            key: Key from make_key
+            value: Tool output to cache
+            ttl: Lifetime of this entry in seconds (defaults to the cache TTL)
+        """
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached tool outputs."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get cache usage statistics.
+
+        Returns:
+            Dictionary with entry count, hits and misses
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl,
+                'query_ttl_seconds': self.query_ttl,
+                'hits': self._hits,
+                'misses': self._misses
+            }
+
+    def __len__(self) -> int:
+        """Number of cached tool outputs."""
+        return len(self._entries)
+
+
+class CachedTool(BaseTool):
+    """
+    Proxy around a tool that serves repeated calls from an ActionCache.
+
+    The wrapped tool's _run is called directly, so callbacks see a single tool
+    run whether or not the output came from the cache. Cache hits dispatch an
+    ACTION_CACHE_HIT_EVENT custom event to the run's callback handlers.
+    """
+
+    tool: BaseTool
+    action_cache: ActionCache
+
+    def __init__(self, tool: BaseTool, action_cache: ActionCache, **kwargs: Any):
+        super().__init__(
+            name=tool.name,
+            description=tool.description,
+            args_schema=tool.args_schema,
+            return_direct=tool.return_direct,
+            tool=tool,
+            action_cache=action_cache,
+            **kwargs
+        )
+
+    def _forward_kwargs(self, kwargs: Dict[str, Any], run_manager: Any) -> Dict[str, Any]:
+        """Pass the run manager on only if the wrapped tool accepts one."""
+        if run_manager is not None and 'run_manager' in inspect.signature(self.tool._run).parameters:
+            return dict(kwargs, run_manager=run_manager)
+        return kwargs
+
+    @staticmethod
+    def _is_cacheable(output: Any) -> bool:
+        """Only plain successful text outputs are safe to replay."""
+        return isinstance(output, str) and not output.startswith('Error')
+
+    def _is_read_only(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> bool:
+        """Whether the call only reads data (always true except for data-modifying SQL)."""
+        if self.name != SQL_QUERY_TOOL:
+            return True
+        statement = kwargs.get('query', args[0] if args else '')
+        return _is_read_only_sql(str(statement))
+
+    def _entry_ttl(self) -> Optional[float]:
+        """Lifetime of this tool's cached outputs, None for the cache default."""
+        return self.action_cache.query_ttl if self.name == SQL_QUERY_TOOL else None
+
+    def _cache_key(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Optional[bytes]:
+        """Key for a read-only call, or None if its output is not cached."""
+        if self._entry_ttl() == 0:
+            return None
+        return self.action_cache.make_key(self.name, args, kwargs)
+
+    def _run(self, *args: Any, run_manager: Any = None, **kwargs: Any) -> Any:
+        if not self._is_read_only(args, kwargs):
+            # Writes are never cached and invalidate everything read so far
+            output = self.tool._run(*args, **self._forward_kwargs(kwargs, run_manager))
+            self.action_cache.clear()
+            return output
+
+        key = self._cache_key(args, kwargs)
+        cached = self.action_cache.get(key) if key is not None else None
+        if cached is not None:
+            logger.debug("Action cache hit for tool '%s'", self.name)
+            try:
+                dispatch_custom_event(ACTION_CACHE_HIT_EVENT, {'tool': self.name})
+            except RuntimeError:
+                pass  # Called outside a traced run, nobody to notify
+            return cached
+
+        output = self.tool._run(*args, **self._forward_kwargs(kwargs, run_manager))
+        if key is not None and self._is_cacheable(output):
+            self.action_cache.set(key, output, self._entry_ttl())
+        return output
+
+    async def _arun(self, *args: Any, run_manager: Any = None, **kwargs: Any) -> Any:
+        if not self._is_read_only(args, kwargs):
+            # Writes are never cached and invalidate everything read so far
+            output = await self.tool._arun(*args, **self._forward_kwargs(kwargs, run_manager))
+            self.action_cache.clear()
+            return output
+
+        key = self._cache_key(args, kwargs)
+        cached = self.action_cache.get(key) if key is not None else None
+        if cached is not None:
+            logger.debug("Action cache hit for tool '%s'", self.name)
+            try:
+                await adispatch_custom_event(ACTION_CACHE_HIT_EVENT, {'tool': self.name})
+            except RuntimeError:
+                pass  # Called outside a traced run, nobody to notify
+            return cached
+
+        output = await self.tool._arun(*args, **self._forward_kwargs(kwargs, run_manager))
+        if key is not None and self._is_cacheable(output):
+            self.action_cache.set(key, output, self._entry_ttl())
+        return output
+
+
+def cache_tool_actions(tools: Iterable[BaseTool], action_cache: ActionCache,
+                       tool_names: Iterable[str] = CACHEABLE_TOOLS) -> List[BaseTool]:
+    """
+    Wrap the cacheable tools in a list with CachedTool proxies.
+
+    Args:
+        tools: Tools to wrap
+        action_cache: Cache shared by the wrapped tools
+        tool_names: Names of the tools whose outputs may be cached
+
+    Returns:
+        List of tools with cacheable tools replaced by proxies
+    """
+    tool_names = frozenset(tool_names)
+    return [CachedTool(tool, action_cache) if tool.name in tool_names else tool for tool in tools]
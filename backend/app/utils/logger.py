@@ -6,6 +6,7 @@ This module provides a comprehensive logging system with the following features:
 - Daily log rotation with timestamp prefixes
 - Separate directories for different log levels
 - Thread-safe operations for concurrent Flask requests
+- File writes handled by a background listener thread, off the request path
 - Configurable log levels and formatting
 - Automatic directory creation
 
@@ -28,19 +29,32 @@ Log Files Structure:
         └── ...
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 import sys
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict
+from typing import Any, Callable, Dict, Optional, TextIO, Tuple
 
 # Thread-safe lock for logger initialization
 _logger_lock = threading.Lock()
 _initialized_loggers: Dict[str, logging.Logger] = {}
 
+# Logging configuration, read from the environment once on first use
+_config: Optional['LoggerConfig'] = None
+_config_lock = threading.Lock()
+
+# Handlers shared by every logger, keyed by (destination, level name)
+_shared_handlers: Dict[Tuple[str, str], logging.Handler] = {}
+_handlers_lock = threading.Lock()
+
+# Background listener that writes queued records to the log files
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
 
 class TimestampedFileHandler(logging.handlers.TimedRotatingFileHandler):
     """
@@ -105,13 +119,16 @@ class TimestampedFileHandler(logging.handlers.TimedRotatingFileHandler):
             self.stream = self._open()
 
     def _cleanup_old_logs(self):
-        """Remove old log files beyond the backup count."""
+        """
+        Remove old log files beyond the backup count.
+
+        Files are named YYYY-MM-DD_level.log, so sorting by name orders them
+        by date without a stat() call per file.
+        """
         if self.backupCount > 0:
-            log_files = list(self.log_dir.glob(f"*_{self.level_name}.log"))
-            log_files.sort(key=lambda f: f.stat().st_mtime)
+            log_files = sorted(self.log_dir.glob(f"*_{self.level_name}.log"))
 
-            while len(log_files) > self.backupCount:
-                oldest_file = log_files.pop(0)
+            for oldest_file in log_files[:-self.backupCount]:
                 try:
                     oldest_file.unlink()
                 except OSError:
@@ -123,6 +140,9 @@ class ColoredConsoleFormatter(logging.Formatter):
     Console formatter with color coding for different log levels.
 
     Provides visual distinction between log levels in console output.
+    Colors are only applied when the output stream is a terminal, and the
+    record's level name is restored after formatting so other handlers see
+    the original value.
     """
 
     # ANSI color codes
@@ -135,15 +155,46 @@ class ColoredConsoleFormatter(logging.Formatter):
         'RESET': '\033[0m'  # Reset
     }
 
+    # Colored level names, built once
+    COLORED_LEVEL_NAMES = {
+        level: f"{color}{level}\033[0m" for level, color in COLORS.items() if level != 'RESET'
+    }
+
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None,
+                 stream: Optional[TextIO] = None, use_color: Optional[bool] = None):
+        """
+        Initialize the formatter.
+
+        Args:
+            fmt: Log format string
+            datefmt: Date format string
+            stream: Stream the handler writes to, used to detect a terminal
+                (defaults to stdout)
+            use_color: Force colors on or off instead of detecting a terminal
+        """
+        super().__init__(fmt, datefmt)
+        if use_color is None:
+            stream = stream if stream is not None else sys.stdout
+            isatty = getattr(stream, 'isatty', None)
+            use_color = bool(isatty and isatty())
+        self.use_color = use_color
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with color coding."""
-        color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
-        reset = self.COLORS['RESET']
+        if not self.use_color:
+            return super().format(record)
 
-        # Add color to level name
-        record.levelname = f"{color}{record.levelname}{reset}"
+        colored = self.COLORED_LEVEL_NAMES.get(record.levelname)
+        if colored is None:
+            return super().format(record)
 
-        return super().format(record)
+        # Color the level name for this handler only
+        levelname = record.levelname
+        record.levelname = colored
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
 class LoggerConfig:
@@ -178,6 +229,81 @@ class LoggerConfig:
             self.log_level = 'INFO'
 
 
+def _get_config() -> LoggerConfig:
+    """Get the process-wide logging configuration, creating it on first use."""
+    global _config
+    if _config is None:
+        with _config_lock:
+            if _config is None:
+                _config = LoggerConfig()
+    return _config
+
+
+def _get_shared_handler(key: Tuple[str, str], factory: Callable[[], logging.Handler]) -> logging.Handler:
+    """
+    Get the handler for a destination, creating it on first use.
+
+    Sharing handlers keeps one open file per log file instead of one per
+    logger. Handlers serialize their own writes, so concurrent use is safe.
+
+    Args:
+        key: (destination, level name) identifying the handler
+        factory: Creates the handler when it does not exist yet
+
+    Returns:
+        The shared handler
+    """
+    with _handlers_lock:
+        handler = _shared_handlers.get(key)
+        if handler is None:
+            handler = factory()
+            _shared_handlers[key] = handler
+        return handler
+
+
+def _create_file_handler(log_dir: Path, level_name: str, level: int, config: LoggerConfig) -> logging.Handler:
+    """Create a daily file handler for one log level."""
+    handler = TimestampedFileHandler(
+        log_dir=str(log_dir),
+        level_name=level_name,
+        backupCount=config.log_backup_count
+    )
+    handler.setLevel(level)
+    handler.setFormatter(logging.Formatter(config.file_format))
+    return handler
+
+
+def _create_queued_file_handler(config: LoggerConfig) -> logging.Handler:
+    """
+    Create the handler that forwards records to the log files via a queue.
+
+    Loggers only enqueue records; a QueueListener thread formats them and
+    writes them to the info and error files, so disk I/O never blocks the
+    calling thread. The listener is stopped (and the queue flushed) at exit.
+    """
+    global _queue_listener
+
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue,
+        _create_file_handler(config.info_log_dir, 'info', logging.INFO, config),
+        _create_file_handler(config.error_log_dir, 'error', logging.ERROR, config),
+        respect_handler_level=True
+    )
+    _queue_listener.start()
+    atexit.register(_queue_listener.stop)
+
+    return logging.handlers.QueueHandler(log_queue)
+
+
+def _create_console_handler(config: LoggerConfig) -> logging.Handler:
+    """Create the colored stdout handler."""
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setLevel(getattr(logging, config.log_level))
+    handler.setFormatter(ColoredConsoleFormatter(config.console_format, stream=sys.stdout))
+    return handler
+
+
 def setup_logger(name: str, config: LoggerConfig) -> logging.Logger:
     """
     Set up a logger with file and console handlers.
@@ -195,34 +321,19 @@ def setup_logger(name: str, config: LoggerConfig) -> logging.Logger:
     # Clear any existing handlers to avoid duplicates
     logger.handlers.clear()
 
-    # File handlers for different log levels
+    # Info and error log files, written by the shared queue listener
     if config.log_to_file:
-        # Info and above to info directory
-        info_handler = TimestampedFileHandler(
-            log_dir=str(config.info_log_dir),
-            level_name='info',
-            backupCount=config.log_backup_count
-        )
-        info_handler.setLevel(logging.INFO)
-        info_handler.setFormatter(logging.Formatter(config.file_format))
-        logger.addHandler(info_handler)
-
-        # Error and above to error directory
-        error_handler = TimestampedFileHandler(
-            log_dir=str(config.error_log_dir),
-            level_name='error',
-            backupCount=config.log_backup_count
-        )
-        error_handler.setLevel(logging.ERROR)
-        error_handler.setFormatter(logging.Formatter(config.file_format))
-        logger.addHandler(error_handler)
+        logger.addHandler(_get_shared_handler(
+            (str(config.base_log_dir), 'queue'),
+            lambda: _create_queued_file_handler(config)
+        ))
 
-    # Console handler
+    # Console handler, written directly for immediate feedback
     if config.log_to_console:
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(getattr(logging, config.log_level))
-        console_handler.setFormatter(ColoredConsoleFormatter(config.console_format))
-        logger.addHandler(console_handler)
+        logger.addHandler(_get_shared_handler(
+            ('stdout', config.log_level),
+            lambda: _create_console_handler(config)
+        ))
 
     # Prevent propagation to root logger
     logger.propagate = False
@@ -236,7 +347,9 @@ def get_logger(name: str) -> logging.Logger:
 
     This function implements thread-safe singleton pattern for loggers.
     Each unique name gets one logger instance that persists for the
-    application lifetime.
+    application lifetime. Known names are returned without taking the lock,
+    and the LOG_* environment settings are read once, when the first logger
+    is created.
 
     Args:
         name: Logger name (typically __name__ from calling module)
@@ -251,19 +364,36 @@ def get_logger(name: str) -> logging.Logger:
         logger.info("Application started")
         logger.error("An error occurred", exc_info=True)
     """
+    # Fast path: dict.get is atomic, so configured loggers need no lock
+    logger = _initialized_loggers.get(name)
+    if logger is not None:
+        return logger
+
     with _logger_lock:
-        if name not in _initialized_loggers:
-            config = LoggerConfig()
-            _initialized_loggers[name] = setup_logger(name, config)
+        logger = _initialized_loggers.get(name)
+        if logger is None:
+            logger = setup_logger(name, _get_config())
+            _initialized_loggers[name] = logger
+
+        return logger
 
-        return _initialized_loggers[name]
+
+def _safe_repr(value: Any, limit: int = 120) -> str:
+    """Repr of a value, truncated to limit characters with the full length noted."""
+    text = repr(value)
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}...<{len(text)} chars>"
 
 
 def log_function_call(func_name: str, args: tuple = (), kwargs: dict = None) -> None:
     """
     Utility function to log function calls with parameters.
 
-    Useful for debugging and tracing application flow.
+    Useful for debugging and tracing application flow. Calls are logged at
+    DEBUG level, and nothing is formatted unless DEBUG logging is enabled.
+    Each argument is shown as a repr capped at 120 characters, so large
+    payloads do not bloat the log.
 
     Args:
         func_name: Name of the function being called
@@ -271,13 +401,18 @@ def log_function_call(func_name: str, args: tuple = (), kwargs: dict = None) ->
         kwargs: Keyword arguments passed to function
     """
     logger = get_logger('function_calls')
-    kwargs = kwargs or {}
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+
+    if not args and not kwargs:
+        logger.debug("Calling %s()", func_name)
+        return
 
-    args_str = ', '.join(str(arg) for arg in args)
-    kwargs_str = ', '.join(f"{k}={v}" for k, v in kwargs.items())
+    args_str = ', '.join(map(_safe_repr, args))
+    kwargs_str = ', '.join(f"{k}={_safe_repr(v)}" for k, v in (kwargs or {}).items())
 
     params = ', '.join(filter(None, [args_str, kwargs_str]))
-    logger.debug(f"Calling {func_name}({params})")
+    logger.debug("Calling %s(%s)", func_name, params)
 
 
 def log_exception(logger: logging.Logger, exception: Exception, context: str = "") -> None:
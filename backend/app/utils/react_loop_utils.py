@@ -16,7 +16,153 @@ Functions:
 
 import re
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from typing import Dict, Any, Iterable, Iterator, Optional, List, NamedTuple
+
+try:
+    import re2
+except ImportError:  # optional (google-re2), re is the fallback
+    re2 = None
+
+# Common patterns for thoughts in LangChain agents, combined into one alternation
+# so the log is scanned once. Each branch has one group and branches are listed
+# in order of preference. These follow the explicit "Thought:" branch.
+_LINE_THOUGHT_BRANCHES = (
+    r"|I need to\s*([^\n]*)"
+    r"|Let me\s*([^\n]*)"
+    r"|I should\s*([^\n]*)"
+    r"|First,?\s*([^\n]*)"
+    r"|Now\s*([^\n]*)"
+    r"|To answer this\s*([^\n]*)"
+    r"|I'll\s*([^\n]*)"
+)
+
+if re2 is not None:
+    # RE2 matches in linear time on any log. It has no lookarounds, so the
+    # Thought branch consumes its terminator (the captured group is the same).
+    _THOUGHT_RE = re2.compile(
+        r"(?is)Thought:\s*(.*?)(?:\n(?:Action|Final Answer)|$)" + _LINE_THOUGHT_BRANCHES
+    )
+else:
+    # The leading lookahead on the branches' first letters lets the engine
+    # skip other positions without trying every branch
+    _THOUGHT_RE = re.compile(
+        r"(?=[TILFN])(?:Thought:\s*(.*?)(?=\n(?:Action|Final Answer)|$)" + _LINE_THOUGHT_BRANCHES + ")",
+        re.IGNORECASE | re.DOTALL
+    )
+
+
+class ToolInfo(NamedTuple):
+    """Human-readable category, description, purpose and display icon of an agent tool."""
+    category: str
+    description: str
+    purpose: str
+    icon: str = '🔧'
+
+
+# Descriptions of the known agent tools
+_TOOL_CATEGORIES: Dict[str, ToolInfo] = {
+    'sql_db_list_tables': ToolInfo(
+        category='schema_exploration',
+        description='Listing all available tables in the database',
+        purpose='Understanding database structure'
+    ),
+    'sql_db_schema': ToolInfo(
+        category='schema_exploration',
+        description='Examining table schema and structure',
+        purpose='Understanding table columns and relationships'
+    ),
+    'sql_db_query': ToolInfo(
+        category='data_retrieval',
+        description='Executing SQL query to retrieve data',
+        purpose='Getting the actual data to answer the question'
+    ),
+    'sql_db_query_checker': ToolInfo(
+        category='validation',
+        description='Validating SQL query syntax and logic',
+        purpose='Ensuring query correctness before execution'
+    ),
+    'list_sql_database': ToolInfo(
+        category='schema_exploration',
+        description='Listing database tables and structure',
+        purpose='Understanding available data sources'
+    ),
+    'info_sql_database': ToolInfo(
+        category='schema_exploration',
+        description='Getting detailed table information',
+        purpose='Understanding table schemas and relationships'
+    ),
+    'query_sql_database': ToolInfo(
+        category='data_retrieval',
+        description='Executing SQL query against database',
+        purpose='Retrieving data to answer the question'
+    ),
+    'query_sql_checker': ToolInfo(
+        category='validation',
+        description='Checking SQL query for errors',
+        purpose='Validating query syntax and logic'
+    )
+}
+
+# Result types that follow from the tool alone
+_SIMPLE_RESULT_TYPES = {
+    'sql_db_list_tables': 'table_list',
+    'list_sql_database': 'table_list',
+    'sql_db_schema': 'schema_info',
+    'info_sql_database': 'schema_info',
+    'sql_db_query_checker': 'validation_result',
+    'query_sql_checker': 'validation_result'
+}
+
+# Tools that execute SQL queries
+_SQL_QUERY_TOOLS = frozenset({'sql_db_query', 'query_sql_database'})
+
+# (keyword, score bonus) pairs for SQL features that make a query more complex
+_SQL_COMPLEXITY_BONUSES = (('JOIN', 2), ('GROUP BY', 1), ('ORDER BY', 1))
+
+# Display label, color and rough execution time for each tool category
+_CATEGORY_LABELS = {
+    'schema_exploration': 'Database Exploration',
+    'data_retrieval': 'Data Query',
+    'validation': 'Query Validation',
+    'unknown': 'Other Action'
+}
+
+_CATEGORY_COLORS = {
+    'schema_exploration': '#3498db',  # Blue
+    'data_retrieval': '#2ecc71',  # Green
+    'validation': '#f39c12',  # Orange
+    'unknown': '#95a5a6'  # Gray
+}
+
+_EXEC_TIME_ESTIMATES = {
+    'schema_exploration': '~1s',
+    'data_retrieval': '~2-3s',
+    'validation': '~1s',
+    'unknown': '~1-2s'
+}
+
+# SQL keywords that start a new line in formatted queries
+_MAJOR_SQL_KEYWORDS = (
+    'SELECT', 'FROM', 'WHERE', 'JOIN', 'INNER JOIN', 'LEFT JOIN', 'RIGHT JOIN',
+    'GROUP BY', 'ORDER BY', 'HAVING', 'LIMIT', 'UNION', 'UNION ALL'
+)
+
+# Major keywords to break lines before, matched in one pass. 'JOIN' also breaks
+# 'INNER JOIN', 'LEFT JOIN' and 'RIGHT JOIN' before the bare JOIN, as the former
+# one-substitution-per-keyword loop did, so those are not listed separately.
+_SQL_KEYWORD_RE = re.compile(
+    r'\b(?:SELECT|FROM|WHERE|JOIN|GROUP BY|ORDER BY|HAVING|LIMIT|UNION ALL|UNION)\b',
+    re.IGNORECASE
+)
+
+# Queries shorter than this are left on one line
+_SHORT_QUERY_LENGTH = 40
+
+# Only this many leading characters of a line need uppercasing to test for a keyword prefix
+_MAJOR_KEYWORD_PREFIX_LEN = max(len(keyword) for keyword in _MAJOR_SQL_KEYWORDS)
+
+_SENTENCE_END_RE = re.compile(r'[.!?]')
 
 
 def extract_thought_from_log(log_text: str) -> Optional[str]:
@@ -32,100 +178,98 @@ def extract_thought_from_log(log_text: str) -> Optional[str]:
     if not log_text:
         return None
 
-    # Common patterns for thoughts in LangChain agents
-    thought_patterns = [
-        r"Thought:\s*(.*?)(?=\n(?:Action|Final Answer)|$)",
-        r"I need to\s*(.*?)(?=\n|$)",
-        r"Let me\s*(.*?)(?=\n|$)",
-        r"I should\s*(.*?)(?=\n|$)",
-        r"First,?\s*(.*?)(?=\n|$)",
-        r"Now\s*(.*?)(?=\n|$)",
-        r"To answer this\s*(.*?)(?=\n|$)",
-        r"I'll\s*(.*?)(?=\n|$)"
-    ]
-
-    for pattern in thought_patterns:
-        match = re.search(pattern, log_text, re.IGNORECASE | re.DOTALL)
-        if match:
-            thought = match.group(1).strip()
-            if thought and len(thought) > 5:  # Avoid very short matches
-                return thought
-
-    # If no specific pattern matches, try to extract the first meaningful sentence
-    sentences = log_text.split('.')
-    for sentence in sentences:
-        clean_sentence = sentence.strip()
+    # First match of each branch, by branch preference. Searching resumes just
+    # after the start of the previous match, so a phrase inside another branch's
+    # match is still found.
+    candidates: List[Optional[str]] = [None] * _THOUGHT_RE.groups
+    match = _THOUGHT_RE.search(log_text)
+    while match:
+        branch = match.lastindex - 1
+        if candidates[branch] is None:
+            candidates[branch] = match.group(match.lastindex).strip()
+
+            # Stop scanning as soon as the answer is decided: a usable thought
+            # whose more-preferred branches have all been seen already
+            for thought in candidates:
+                if thought is None:
+                    break
+                if len(thought) > 5:
+                    return thought
+        match = _THOUGHT_RE.search(log_text, match.start() + 1)
+
+    for thought in candidates:
+        if thought and len(thought) > 5:  # Avoid very short matches
+            return thought
+
+    # If no specific pattern matches, try to extract the first meaningful sentence,
+    # finding sentence ends one at a time rather than splitting the whole log
+    start = 0
+    while start <= len(log_text):
+        end = log_text.find('.', start)
+        if end == -1:
+            end = len(log_text)
+        clean_sentence = log_text[start:end].strip()
         if (len(clean_sentence) > 20 and
                 not clean_sentence.startswith(('Action:', 'Final Answer:', 'Observation:'))):
             return clean_sentence
+        start = end + 1
 
     return None
 
 
+@lru_cache(maxsize=32)
+def get_tool_info(tool_name: str) -> ToolInfo:
+    """
+    Categorize and describe the tool action with human-readable information.
+
+    Args:
+        tool_name: Name of the tool being used
+
+    Returns:
+        ToolInfo with category, description, purpose and icon
+    """
+    info = _TOOL_CATEGORIES.get(tool_name)
+    if info is not None:
+        return info
+
+    return ToolInfo(
+        category='unknown',
+        description=f'Using tool: {tool_name}',
+        purpose='Performing agent action'
+    )
+
+
+@lru_cache(maxsize=32)
 def categorize_tool_action(tool_name: str) -> Dict[str, str]:
     """
     Categorize and describe the tool action with human-readable information.
 
+    Dictionary form of get_tool_info. Results are memoized per tool name, so
+    the returned dictionary is shared between calls and must not be modified.
+
     Args:
         tool_name: Name of the tool being used
 
     Returns:
         Dictionary with category, description, and purpose
     """
-    tool_categories = {
-        'sql_db_list_tables': {
-            'category': 'schema_exploration',
-            'description': 'Listing all available tables in the database',
-            'purpose': 'Understanding database structure'
-        },
-        'sql_db_schema': {
-            'category': 'schema_exploration',
-            'description': 'Examining table schema and structure',
-            'purpose': 'Understanding table columns and relationships'
-        },
-        'sql_db_query': {
-            'category': 'data_retrieval',
-            'description': 'Executing SQL query to retrieve data',
-            'purpose': 'Getting the actual data to answer the question'
-        },
-        'sql_db_query_checker': {
-            'category': 'validation',
-            'description': 'Validating SQL query syntax and logic',
-            'purpose': 'Ensuring query correctness before execution'
-        },
-        'list_sql_database': {
-            'category': 'schema_exploration',
-            'description': 'Listing database tables and structure',
-            'purpose': 'Understanding available data sources'
-        },
-        'info_sql_database': {
-            'category': 'schema_exploration',
-            'description': 'Getting detailed table information',
-            'purpose': 'Understanding table schemas and relationships'
-        },
-        'query_sql_database': {
-            'category': 'data_retrieval',
-            'description': 'Executing SQL query against database',
-            'purpose': 'Retrieving data to answer the question'
-        },
-        'query_sql_checker': {
-            'category': 'validation',
-            'description': 'Checking SQL query for errors',
-            'purpose': 'Validating query syntax and logic'
-        }
+    info = get_tool_info(tool_name)
+    return {
+        'category': info.category,
+        'description': info.description,
+        'purpose': info.purpose
     }
 
-    return tool_categories.get(tool_name, {
-        'category': 'unknown',
-        'description': f'Using tool: {tool_name}',
-        'purpose': 'Performing agent action'
-    })
-
 
+@lru_cache(maxsize=256)
 def format_sql_query(query_text: str) -> str:
     """
     Format SQL query for better readability with proper indentation and line breaks.
 
+    Results are memoized per query text, since agents often check and then
+    run the same query. Short queries and queries that already span several
+    lines are returned stripped but otherwise unchanged.
+
     Args:
         query_text: Raw SQL query string
 
@@ -138,16 +282,12 @@ def format_sql_query(query_text: str) -> str:
     # Basic SQL formatting
     query = query_text.strip()
 
-    # Add line breaks for major keywords
-    major_keywords = [
-        'SELECT', 'FROM', 'WHERE', 'JOIN', 'INNER JOIN', 'LEFT JOIN', 'RIGHT JOIN',
-        'GROUP BY', 'ORDER BY', 'HAVING', 'LIMIT', 'UNION', 'UNION ALL'
-    ]
+    # Short or already formatted queries gain nothing from reformatting
+    if len(query) < _SHORT_QUERY_LENGTH or _at_least(query, '\n', 2):
+        return query
 
-    for keyword in major_keywords:
-        # Use word boundaries to avoid partial matches
-        pattern = f'\\b{re.escape(keyword)}\\b'
-        query = re.sub(pattern, f'\n{keyword}', query, flags=re.IGNORECASE)
+    # Add line breaks for major keywords
+    query = _SQL_KEYWORD_RE.sub(lambda match: '\n' + match.group().upper(), query)
 
     # Add proper indentation for sub-clauses
     lines = query.split('\n')
@@ -159,18 +299,14 @@ def format_sql_query(query_text: str) -> str:
             continue
 
         # Main clauses start at column 0
-        if any(stripped.upper().startswith(kw) for kw in major_keywords):
+        if stripped[:_MAJOR_KEYWORD_PREFIX_LEN].upper().startswith(_MAJOR_SQL_KEYWORDS):
             formatted_lines.append(stripped)
         else:
             # Sub-clauses get indented
             formatted_lines.append(f"    {stripped}")
 
-    # Clean up extra whitespace and empty lines
-    result = '\n'.join(formatted_lines)
-    result = re.sub(r'\n\s*\n', '\n', result)
-    result = re.sub(r'^\n+', '', result)
-
-    return result
+    # Empty lines were skipped above, so the joined query has no blank or leading lines
+    return '\n'.join(formatted_lines)
 
 
 def detect_result_type(result_text: str, tool_name: str) -> str:
@@ -184,52 +320,57 @@ def detect_result_type(result_text: str, tool_name: str) -> str:
     Returns:
         String describing the result type for UI formatting
     """
-    if not result_text or result_text.strip() == "":
+    if not result_text:
+        return "empty"
+
+    stripped = result_text.strip()
+    if not stripped:
         return "empty"
 
     # Tool-specific result type detection
-    if tool_name in ['sql_db_list_tables', 'list_sql_database']:
-        return "table_list"
-    elif tool_name in ['sql_db_schema', 'info_sql_database']:
-        return "schema_info"
-    elif tool_name in ['sql_db_query', 'query_sql_database']:
+    result_type = _SIMPLE_RESULT_TYPES.get(tool_name)
+    if result_type is not None:
+        return result_type
+    elif tool_name in _SQL_QUERY_TOOLS:
         # Check if it looks like tabular data
         if '|' in result_text and '\n' in result_text:
             return "tabular_data"
-        elif result_text.strip().startswith('(') and result_text.strip().endswith(')'):
+        elif stripped.startswith('(') and stripped.endswith(')'):
             return "sql_result_tuple"
-        elif result_text.strip().startswith('[') and result_text.strip().endswith(']'):
+        elif stripped.startswith('[') and stripped.endswith(']'):
             return "sql_result_list"
         else:
             return "sql_result"
-    elif tool_name in ['sql_db_query_checker', 'query_sql_checker']:
-        return "validation_result"
     else:
         # Generic content-based detection
-        if result_text.count('\n') > 3 and '|' in result_text:
+        if _at_least(result_text, '\n', 4) and '|' in result_text:
             return "tabular_data"
         elif result_text.startswith('CREATE TABLE') or result_text.startswith('CREATE'):
             return "schema_definition"
-        elif result_text.count(',') > 3 and len(result_text) < 200:
+        elif len(result_text) < 200 and _at_least(result_text, ',', 4):
             return "list_data"
         else:
             return "text"
 
 
-def process_intermediate_steps(steps: List[Any]) -> List[Dict[str, Any]]:
+def process_intermediate_steps(steps: Iterable[Any]) -> Iterator[Dict[str, Any]]:
     """
     Enhanced processing of intermediate execution steps to extract ReAct loop information.
 
+    Steps are processed lazily; wrap the call in list() to keep the results.
+
     Args:
         steps: Raw intermediate steps from agent execution
 
-    Returns:
-        List of formatted ReAct step dictionaries
+    Yields:
+        Formatted ReAct step dictionaries
     """
-    processed_steps = []
     step_counter = 0
 
     for i, step in enumerate(steps):
+        # One timestamp per step, shared by the step and its metadata
+        now_iso = datetime.now().isoformat()
+
         try:
             step_counter += 1
 
@@ -245,35 +386,27 @@ def process_intermediate_steps(steps: List[Any]) -> List[Dict[str, Any]]:
                 thought = extract_thought_from_log(action_log)
 
                 # Get tool categorization
-                tool_info = categorize_tool_action(tool_name)
+                tool_info = get_tool_info(tool_name)
 
                 # Process tool input based on tool type
                 formatted_input = tool_input
-                if tool_name in ['sql_db_query', 'query_sql_database'] and isinstance(tool_input, str):
+                if tool_name in _SQL_QUERY_TOOLS and isinstance(tool_input, str):
                     formatted_input = format_sql_query(tool_input)
 
                 # Process observation
                 observation_text = str(observation) if observation else "No result"
 
-                # For SQL query results, try to structure them better
-                if tool_name in ['sql_db_query', 'query_sql_database'] and observation_text:
-                    # Try to detect if this is tabular data
-                    lines = observation_text.strip().split('\n')
-                    if len(lines) > 1 and '|' in observation_text:
-                        # Looks like formatted table data - keep as is for now
-                        pass
-
                 step_info = {
                     "step_number": step_counter,
                     "step_type": "react_cycle",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": now_iso,
                     "thought": thought,
                     "action": {
                         "tool": tool_name,
-                        "category": tool_info['category'],
-                        "description": tool_info['description'],
-                        "purpose": tool_info['purpose'],
-                        "icon": tool_info.get('icon', '🔧'),
+                        "category": tool_info.category,
+                        "description": tool_info.description,
+                        "purpose": tool_info.purpose,
+                        "icon": tool_info.icon,
                         "input": formatted_input,
                         "raw_input": tool_input,
                         "full_log": action_log
@@ -286,40 +419,40 @@ def process_intermediate_steps(steps: List[Any]) -> List[Dict[str, Any]]:
                     },
                     "metadata": {
                         "original_step_index": i,
-                        "processing_time": datetime.now().isoformat()
+                        "processing_time": now_iso
                     }
                 }
 
-                processed_steps.append(step_info)
+                yield step_info
             else:
                 # Handle malformed steps
+                step_text = str(step)
                 step_info = {
                     "step_number": step_counter,
                     "step_type": "malformed",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": now_iso,
                     "error": "Could not parse step structure",
-                    "raw_step": str(step)[:500] + "..." if len(str(step)) > 500 else str(step),
+                    "raw_step": step_text[:500] + "..." if len(step_text) > 500 else step_text,
                     "metadata": {
                         "original_step_index": i,
-                        "processing_time": datetime.now().isoformat()
+                        "processing_time": now_iso
                     }
                 }
-                processed_steps.append(step_info)
+                yield step_info
 
         except Exception as err:
-            processed_steps.append({
+            step_text = str(step)
+            yield {
                 "step_number": step_counter,
                 "step_type": "error",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso,
                 "error": f"Processing error: {err}",
-                "raw_step": str(step)[:200] + "..." if len(str(step)) > 200 else str(step),
+                "raw_step": step_text[:200] + "..." if len(step_text) > 200 else step_text,
                 "metadata": {
                     "original_step_index": i,
-                    "processing_time": datetime.now().isoformat()
+                    "processing_time": now_iso
                 }
-            })
-
-    return processed_steps
+            }
 
 
 def generate_step_summary(react_steps: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -342,7 +475,7 @@ def generate_step_summary(react_steps: List[Dict[str, Any]]) -> Dict[str, Any]:
         }
 
     categories = {}
-    tools_used = []
+    tools_used = {}  # Insertion-ordered set of tool names
     execution_pattern = []
 
     for step in react_steps:
@@ -352,25 +485,25 @@ def generate_step_summary(react_steps: List[Dict[str, Any]]) -> Dict[str, Any]:
             tool = action.get("tool", "unknown")
 
             categories[category] = categories.get(category, 0) + 1
-            tools_used.append(tool)
+            tools_used[tool] = None
             execution_pattern.append(category)
 
     return {
         "total_steps": len(react_steps),
         "categories": categories,
-        "tools_used": list(set(tools_used)),  # Remove duplicates
+        "tools_used": list(tools_used),  # Unique, in order of first use
         "execution_pattern": execution_pattern,
         "final_action": react_steps[-1].get("action", {}).get("description") if react_steps else None,
         "complexity_score": _calculate_complexity_score(react_steps)
     }
 
 
-def generate_execution_flow(react_steps: List[Dict[str, Any]]) -> List[str]:
+def generate_execution_flow(react_steps: Iterable[Dict[str, Any]]) -> List[str]:
     """
     Generate a high-level execution flow description for user understanding.
 
     Args:
-        react_steps: List of processed ReAct steps
+        react_steps: Processed ReAct steps
 
     Returns:
         List of human-readable flow descriptions
@@ -412,8 +545,7 @@ def format_step_for_display(step: Dict[str, Any]) -> Dict[str, Any]:
             "category_color": _get_category_color(action.get('category')),
             "thought_summary": _summarize_thought(step.get('thought')),
             "result_summary": _summarize_result(observation.get('result', ''), observation.get('result_type')),
-            "sql_formatted": action.get('input') if action.get('tool') in ['sql_db_query',
-                                                                           'query_sql_database'] else None,
+            "sql_formatted": action.get('input') if action.get('tool') in _SQL_QUERY_TOOLS else None,
             "execution_time_estimate": _estimate_execution_time(action.get('category'))
         }
     }
@@ -421,6 +553,16 @@ def format_step_for_display(step: Dict[str, Any]) -> Dict[str, Any]:
     return display_step
 
 
+def _at_least(text: str, char: str, count: int) -> bool:
+    """Check whether text contains char at least count times, stopping once it does."""
+    position = -1
+    for _ in range(count):
+        position = text.find(char, position + 1)
+        if position == -1:
+            return False
+    return True
+
+
 def _calculate_complexity_score(react_steps: List[Dict[str, Any]]) -> int:
     """Calculate a complexity score based on the execution pattern."""
     score = 0
@@ -439,38 +581,23 @@ def _calculate_complexity_score(react_steps: List[Dict[str, Any]]) -> int:
                 score += 2
 
             # Bonus for SQL complexity
-            if action.get("tool") in ["sql_db_query", "query_sql_database"]:
-                sql_input = action.get("input", "")
-                if "JOIN" in sql_input.upper():
-                    score += 2
-                if "GROUP BY" in sql_input.upper():
-                    score += 1
-                if "ORDER BY" in sql_input.upper():
-                    score += 1
+            if action.get("tool") in _SQL_QUERY_TOOLS:
+                sql_input = action.get("input", "").upper()
+                for keyword, bonus in _SQL_COMPLEXITY_BONUSES:
+                    if keyword in sql_input:
+                        score += bonus
 
     return min(score, 10)  # Cap at 10
 
 
 def _get_category_label(category: str) -> str:
     """Get human-readable label for category."""
-    labels = {
-        'schema_exploration': 'Database Exploration',
-        'data_retrieval': 'Data Query',
-        'validation': 'Query Validation',
-        'unknown': 'Other Action'
-    }
-    return labels.get(category, category.title())
+    return _CATEGORY_LABELS.get(category) or category.title()
 
 
 def _get_category_color(category: str) -> str:
     """Get color code for category visualization."""
-    colors = {
-        'schema_exploration': '#3498db',  # Blue
-        'data_retrieval': '#2ecc71',  # Green
-        'validation': '#f39c12',  # Orange
-        'unknown': '#95a5a6'  # Gray
-    }
-    return colors.get(category, '#95a5a6')
+    return _CATEGORY_COLORS.get(category, '#95a5a6')
 
 
 def _summarize_thought(thought: Optional[str]) -> Optional[str]:
@@ -482,9 +609,9 @@ def _summarize_thought(thought: Optional[str]) -> Optional[str]:
         return thought
 
     # Try to end at a sentence boundary
-    for i in range(75, min(len(thought), 120)):
-        if thought[i] in '.!?':
-            return thought[:i + 1]
+    end = _SENTENCE_END_RE.search(thought, 75, 120)
+    if end:
+        return thought[:end.end()]
 
     # Fallback to simple truncation
     return thought[:80] + "..."
@@ -518,18 +645,14 @@ def _summarize_result(result: str, result_type: str) -> str:
 
 def _estimate_execution_time(category: str) -> str:
     """Estimate execution time for different categories."""
-    estimates = {
-        'schema_exploration': '~1s',
-        'data_retrieval': '~2-3s',
-        'validation': '~1s',
-        'unknown': '~1-2s'
-    }
-    return estimates.get(category, '~1-2s')
+    return _EXEC_TIME_ESTIMATES.get(category, '~1-2s')
 
 
 # Export all public functions
 __all__ = [
     'extract_thought_from_log',
+    'ToolInfo',
+    'get_tool_info',
     'categorize_tool_action',
     'format_sql_query',
     'detect_result_type',
@@ -0,0 +1,198 @@
+"""
+Semantic Cache for NL-to-SQL Agent
+
+This module provides an embedding-similarity cache that returns a previously
+stored value when a new text is a close paraphrase of a cached one (e.g.
+"Show all US customers" vs "List every customer in the USA").
+
+Prompts are embedded with a small local sentence-transformers model and
+compared by cosine similarity against every cached embedding in a single
+matrix product. The optional dependencies (numpy, sentence-transformers) are
+imported lazily; when they are missing the cache reports itself unavailable
+and every lookup is a miss.
+
+Entries can be stored under a scope (any value comparable with ==, such as
+the settings a response was generated with). A lookup only matches entries
+stored under the same scope, so a closer paraphrase stored under different
+settings never hides a valid match.
+
+Usage:
+    from app.utils.semantic_cache import SemanticCache
+
+    cache = SemanticCache(threshold=0.92)
+    if cache.is_available():
+        cache.store("Show all US customers", "SELECT * FROM customers WHERE country = 'USA'")
+        hit = cache.lookup("List every customer in the USA")
+"""
+
+import threading
+import time
+from typing import Any, List, Optional
+
+from .logger import get_logger
+
+# Initialize logger for this module
+logger = get_logger(__name__)
+
+DEFAULT_EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+
+
+class SemanticCache:
+    """
+    Thread-safe cache keyed by the meaning of a text rather than its exact value.
+
+    Embeddings are L2-normalized when stored, so cosine similarity against all
+    entries is one matrix-vector product. Entries expire after ttl seconds and
+    the oldest entry is evicted once max_entries is reached.
+    """
+
+    def __init__(self, threshold: float = 0.92, max_entries: int = 1000,
+                 ttl: Optional[float] = None, model_name: str = DEFAULT_EMBEDDING_MODEL):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a lookup to count as a hit
+            max_entries: Maximum number of cached entries
+            ttl: Optional lifetime of an entry in seconds (None keeps entries
+                until evicted)
+            model_name: sentence-transformers model used to embed texts
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.model_name = model_name
+
+        self._lock = threading.Lock()
+        self._model = None
+        self._np = None
+        self._available: Optional[bool] = None
+
+        # Parallel storage: row i of the matrix belongs to values[i]/scopes[i]/stored_at[i]
+        self._matrix = None
+        self._values: List[Any] = []
+        self._scopes: List[Any] = []
+        self._stored_at: List[float] = []
+
+    def is_available(self) -> bool:
+        """
+        Check whether the embedding model can be loaded.
+
+        Returns:
+            True if numpy and sentence-transformers are installed and the
+            model loaded, False otherwise
+        """
+        if self._available is None:
+            with self._lock:
+                if self._available is None:
+                    self._available = self._load_model()
+        return self._available
+
+    def _load_model(self) -> bool:
+        """Import the optional dependencies and load the embedding model."""
+        try:
+            import numpy as np
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            logger.warning("Semantic cache disabled: install numpy and sentence-transformers to enable it")
+            return False
+
+        try:
+            self._model = SentenceTransformer(self.model_name)
+            self._np = np
+            logger.info("Semantic cache loaded embedding model: %s", self.model_name)
+            return True
+        except Exception as err:
+            logger.warning("Semantic cache disabled: failed to load model '%s': %s", self.model_name, err)
+            return False
+
+    def _embed(self, text: str):
+        """Embed a text as a unit-length float32 vector."""
+        return self._model.encode(text, normalize_embeddings=True).astype(self._np.float32)
+
+    def _evict_expired(self) -> None:
+        """Drop expired entries. Caller must hold the lock."""
+        if self.ttl is None or not self._stored_at:
+            return
+
+        cutoff = time.time() - self.ttl
+        keep = [i for i, stored_at in enumerate(self._stored_at) if stored_at >= cutoff]
+        if len(keep) == len(self._stored_at):
+            return
+
+        self._matrix = self._matrix[keep] if keep else None
+        self._values = [self._values[i] for i in keep]
+        self._scopes = [self._scopes[i] for i in keep]
+        self._stored_at = [self._stored_at[i] for i in keep]
+
+    def lookup(self, text: str, scope: Any = None) -> Optional[Any]:
+        """
+        Find the cached value for the most similar stored text.
+
+        Args:
+            text: Text to look up
+            scope: Only entries stored under an equal scope are considered
+
+        Returns:
+            The cached value if the best match reaches the threshold, else None
+        """
+        if not self.is_available():
+            return None
+
+        embedding = self._embed(text)
+        with self._lock:
+            self._evict_expired()
+            if self._matrix is None:
+                return None
+
+            scores = self._matrix @ embedding
+            out_of_scope = [i for i, entry_scope in enumerate(self._scopes) if entry_scope != scope]
+            if out_of_scope:
+                scores[out_of_scope] = -self._np.inf
+            best = int(scores.argmax())
+            if scores[best] < self.threshold:
+                return None
+
+            logger.debug("Semantic cache hit (similarity %.3f)", scores[best])
+            return self._values[best]
+
+    def store(self, text: str, value: Any, scope: Any = None) -> None:
+        """
+        Cache a value under the meaning of a text.
+
+        Args:
+            text: Text the value answers
+            value: Value to return for similar texts
+            scope: Scope the value is valid in, matched by lookup()
+        """
+        if not self.is_available():
+            return
+
+        embedding = self._embed(text)
+        np = self._np
+        with self._lock:
+            self._evict_expired()
+            if self._matrix is not None and len(self._values) >= self.max_entries:
+                # Entries are appended in insertion order, so row 0 is the oldest
+                self._matrix = self._matrix[1:] if len(self._values) > 1 else None
+                self._values.pop(0)
+                self._scopes.pop(0)
+                self._stored_at.pop(0)
+
+            row = embedding[np.newaxis, :]
+            self._matrix = row if self._matrix is None else np.vstack((self._matrix, row))
+            self._values.append(value)
+            self._scopes.append(scope)
+            self._stored_at.append(time.time())
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._matrix = None
+            self._values = []
+            self._scopes = []
+            self._stored_at = []
+
+    def __len__(self) -> int:
+        """Number of cached entries."""
+        return len(self._values)
@@ -2,7 +2,7 @@
 
 import { useCallback, useEffect } from 'react';
 import { useChatInternal } from '@/context/ChatContext';
-import { ChatStreamEvent, ConnectionStatus } from '@/services/types';
+import { ChatStreamEvent, ConnectionStatus, unbatchEvents } from '@/services/types';
 
 export function useChatController() {
   // REMOVED: The old eventSource service is no longer needed.
@@ -54,6 +54,12 @@ export function useChatController() {
       case 'heartbeat':
         // Keep-alive signal, no action needed
         break;
+      case 'cache_hit':
+        // Tool output served from the backend action cache; the observation follows as usual
+        break;
+      case 'parse_repair':
+        // The agent's last response was unparseable and is being retried with a hint
+        break;
       case 'error':
         setError(event.message || 'An error occurred during processing');
         break;
@@ -105,7 +111,7 @@ export function useChatController() {
             try {
               const eventData = JSON.parse(jsonString);
               // Funnel the data into our existing event handler
-              handleStreamEvent(eventData);
+              unbatchEvents(eventData).forEach(handleStreamEvent);
             } catch (e) {
               console.error("Failed to parse event data:", jsonString);
             }
@@ -1,6 +1,6 @@
 // src/services/eventSource.ts
 
-import { ChatStreamEvent, ConnectionStatus } from './types';
+import { BatchEvent, ChatStreamEvent, ConnectionStatus, unbatchEvents } from './types';
 
 export class StreamingService {
   private eventSource: EventSource | null = null;
@@ -56,8 +56,8 @@ export class StreamingService {
 
     this.eventSource.onmessage = (event) => {
       try {
-        const data: ChatStreamEvent = JSON.parse(event.data);
-        this.handleStreamEvent(data);
+        const data: ChatStreamEvent | BatchEvent = JSON.parse(event.data);
+        unbatchEvents(data).forEach((streamEvent) => this.handleStreamEvent(streamEvent));
         
         // Reset reconnect attempts on successful message
         this.reconnectAttempts = 0;
@@ -52,8 +52,28 @@ export interface ExecutionCompleteEvent extends StreamEvent {
   type: 'execution_complete';
 }
 
-export interface HeartbeatEvent extends StreamEvent {
+// Heartbeats are sent verbatim from a prebuilt message and carry no timestamp
+export interface HeartbeatEvent extends Omit<StreamEvent, 'timestamp'> {
   type: 'heartbeat';
+  timestamp?: string;
+}
+
+export interface CacheHitEvent extends StreamEvent {
+  type: 'cache_hit';
+  step_number: number;
+  tool: string;
+}
+
+export interface ParseRepairEvent extends StreamEvent {
+  type: 'parse_repair';
+  step_number: number;
+  message: string;
+}
+
+// Several events that arrived together, sent as one SSE message
+export interface BatchEvent {
+  type: 'batch';
+  events: ChatStreamEvent[];
 }
 
 export interface ErrorEvent extends StreamEvent {
@@ -72,8 +92,13 @@ export type ChatStreamEvent =
   | ExecutionSummaryEvent
   | ExecutionCompleteEvent
   | HeartbeatEvent
+  | CacheHitEvent
+  | ParseRepairEvent
   | ErrorEvent;
 
+export const unbatchEvents = (data: ChatStreamEvent | BatchEvent): ChatStreamEvent[] =>
+  data.type === 'batch' ? data.events : [data];
+
 export interface ReActStep {
   step_number: number;
   thought?: string;